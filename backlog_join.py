@@ -0,0 +1,121 @@
+import argparse
+import os
+import re
+
+import pandas as pd
+
+# Colunas da chave nos dois lados do join
+ISSUE_KEY = 'Chave'
+CARD_KEY = '#JIRA\nCard'
+
+# Regra para o mesmo card em várias linhas/abas do backlog:
+#   'last'          - a última ocorrência (última aba em que o card aparece)
+#   'first'         - a primeira ocorrência
+#   'most_complete' - a linha com mais células preenchidas (empate: a última)
+DUPLICATE_RULES = ['last', 'first', 'most_complete']
+DUPLICATE_RULE = os.environ.get('DASHBOARD_BACKLOG_RULE', 'most_complete')
+
+
+# Formato já normalizado de uma chave do Jira (ex.: 'OABDRJ-91'); só o que foge dele passa pelas regras
+_KEY_PATTERN = re.compile(r'[A-Z][A-Z0-9_]*-\d+')
+_BROWSE_PATTERN = re.compile(r'^.*/BROWSE/')
+_SPACE_PATTERN = re.compile(r'\s+')
+_FLOAT_PATTERN = re.compile(r'(\d+)\.0+')
+
+
+def _normalize_key(value):
+    if not isinstance(value, str):
+        if value is None or value != value:
+            return None
+        value = str(value)
+    text = value.strip().upper()
+    if _KEY_PATTERN.fullmatch(text):
+        return text
+    text = _SPACE_PATTERN.sub('', _BROWSE_PATTERN.sub('', text))
+    match = _FLOAT_PATTERN.fullmatch(text)
+    if match:
+        text = match.group(1)
+    return text or None
+
+
+# Normaliza chaves do Jira: sem espaços extras, maiúsculas, chave extraída de links '.../browse/CHAVE'
+# e números que o Excel transformou em float ('31799.0') de volta a inteiros. Uma passada por valor.
+def normalize_keys(keys):
+    match = _KEY_PATTERN.fullmatch
+    values = [value if value.__class__ is str and match(value) else _normalize_key(value) for value in keys.tolist()]
+    return pd.Series(values, index=keys.index, dtype=object)
+
+
+# Uma linha por card, escolhida pela regra; o índice é a chave normalizada
+def dedupe_backlog(backlog_data, rule=DUPLICATE_RULE):
+    if rule not in DUPLICATE_RULES:
+        raise ValueError(f'regra de duplicidade desconhecida: {rule!r} (use {DUPLICATE_RULES})')
+    keys = normalize_keys(backlog_data[CARD_KEY])
+    backlog = backlog_data[keys.notna()].set_axis(keys[keys.notna()].to_numpy())
+
+    if rule == 'most_complete':
+        # Percorre do fim para o começo: idxmax fica com a última linha entre as mais completas
+        reversed_backlog = backlog.iloc[::-1].reset_index(names='_chave')
+        filled = reversed_backlog.drop(columns='_chave').notna().sum(axis=1)
+        best = filled.groupby(reversed_backlog['_chave'], sort=False).idxmax()
+        return backlog.iloc[len(backlog) - 1 - best.to_numpy()]
+    return backlog[~backlog.index.duplicated(keep=rule)]
+
+
+def _suffix_overlaps(jira_data, backlog):
+    overlap = [column for column in backlog.columns if column in jira_data.columns]
+    if not overlap:
+        return jira_data, backlog
+    return (jira_data.rename(columns={column: f'{column}_x' for column in overlap}),
+            backlog.rename(columns={column: f'{column}_y' for column in overlap}))
+
+
+# Junta o backlog aos itens do Jira: uma linha de saída por item, na ordem dos itens.
+# O backlog é indexado pela chave normalizada e consultado por hash (sem produto de duplicatas).
+def join_backlog(jira_data, backlog_data, rule=DUPLICATE_RULE):
+    if CARD_KEY not in backlog_data.columns:
+        return jira_data
+    backlog = dedupe_backlog(backlog_data, rule)
+    aligned = backlog.reindex(normalize_keys(jira_data[ISSUE_KEY]).to_numpy())
+    jira_data, aligned = _suffix_overlaps(jira_data, aligned.set_axis(jira_data.index))
+    return pd.concat([jira_data, aligned], axis=1)
+
+
+# Resumo da qualidade do join: cards repetidos, cards sem item no Jira e itens sem linha no backlog
+def join_report(issue_keys, backlog_data):
+    if CARD_KEY not in backlog_data.columns:
+        return {'linhas_backlog': len(backlog_data), 'cards': 0, 'linhas_sem_card': len(backlog_data),
+                'cards_duplicados': {}, 'cards_sem_item': [], 'itens_sem_backlog': len(issue_keys)}
+    cards = normalize_keys(backlog_data[CARD_KEY])
+    issues = pd.Index(normalize_keys(pd.Series(issue_keys)).dropna().unique())
+    counts = cards.value_counts()
+    unique_cards = pd.Index(counts.index)
+    return {
+        'linhas_backlog': len(backlog_data),
+        'cards': len(unique_cards),
+        'linhas_sem_card': int(cards.isna().sum()),
+        'cards_duplicados': {card: int(count) for card, count in counts[counts > 1].items()},
+        'cards_sem_item': sorted(unique_cards.difference(issues)),
+        'itens_sem_backlog': int((~issues.isin(unique_cards)).sum()),
+    }
+
+
+if __name__ == "__main__":
+    from backlog_loader import load_backlog_data
+    from jira_loader import load_export_data
+
+    parser = argparse.ArgumentParser(description='Relatório do join entre a exportação do Jira e o backlog')
+    parser.add_argument('export', nargs='?', default='Jira (3).html')
+    parser.add_argument('backlog', nargs='?', default='backlog.xlsx')
+    args = parser.parse_args()
+
+    relatorio = join_report(load_export_data(args.export)[ISSUE_KEY], load_backlog_data(args.backlog))
+    print(f"linhas no backlog: {relatorio['linhas_backlog']} ({relatorio['linhas_sem_card']} sem card)")
+    print(f"cards distintos: {relatorio['cards']}")
+    print(f"itens do Jira sem linha no backlog: {relatorio['itens_sem_backlog']}")
+    print(f"cards repetidos ({len(relatorio['cards_duplicados'])}):")
+    for card, vezes in relatorio['cards_duplicados'].items():
+        print(f'  {card}: {vezes} linhas')
+    print(f"cards sem item no Jira ({len(relatorio['cards_sem_item'])}):")
+    for card in relatorio['cards_sem_item']:
+        print(f'  {card}')
@@ -0,0 +1,141 @@
+import datetime
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from jira_cache import file_hash
+from jira_schema import BACKLOG_COLUMNS, BACKLOG_DATE_COLUMNS, DATE_TEXT_SUFFIX, apply_schema
+
+# Versão da leitura do backlog; entra na chave do arquivo colunar gravado ao lado da planilha
+BACKLOG_VERSION = '2'
+
+# Abaixo deste tamanho a planilha é lida em sequência (criar processos custa mais que ler)
+PARALLEL_MIN_BYTES = 2 * 2 ** 20
+
+CACHE_SUFFIX = '.arrow'
+
+# Formatos (dia primeiro) das datas digitadas como texto na planilha ('22/03/2024', '22/03/24', '18-12-23')
+TEXT_DATE_FORMATS = ['%d/%m/%Y', '%d/%m/%y', '%d-%m-%y', '%d-%m-%Y']
+
+
+# Motor de leitura do Excel: python-calamine (bem mais rápido) quando instalado, senão openpyxl
+def default_engine():
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return 'openpyxl'
+    return 'calamine'
+
+
+# Datas das células de texto, tentando cada formato de TEXT_DATE_FORMATS (NaT quando nenhum serve)
+def _text_dates(text):
+    dates = pd.Series(pd.NaT, index=text.index, dtype='datetime64[ns]')
+    for date_format in TEXT_DATE_FORMATS:
+        missing = dates.isna() & text.notna()
+        if not missing.any():
+            break
+        dates[missing] = pd.to_datetime(text[missing], format=date_format, errors='coerce')
+    return dates
+
+
+# Colunas do Excel que misturam datas e textos (e as de BACKLOG_DATE_COLUMNS, mesmo só com textos)
+# viram colunas de datas: as datas do
+# Excel ficam como estão e os textos com uma data dia/mês/ano são convertidos. O texto original das
+# células que não eram datas vai para '<coluna> (texto)', para não se perder o que não é data.
+def _split_date_columns(df):
+    for column in df.columns:
+        if df[column].dtype != object:
+            continue
+        is_date = df[column].map(lambda value: isinstance(value, datetime.datetime))
+        if not is_date.any() and column not in BACKLOG_DATE_COLUMNS:
+            continue
+        text = df[column].mask(is_date).map(str, na_action='ignore')
+        df[column] = pd.to_datetime(df[column].where(is_date)).fillna(_text_dates(text))
+        df[column + DATE_TEXT_SUFFIX] = text
+    return df
+
+
+# As demais colunas que misturam tipos (ex.: números e textos no card) viram texto,
+# para que o DataFrame possa ser gravado em formato colunar
+def _normalize_mixed_columns(df):
+    for column in df.columns:
+        if df[column].dtype != object:
+            continue
+        values = df[column].dropna()
+        if values.map(type).nunique() > 1:
+            df[column] = df[column].map(str, na_action='ignore')
+    return df
+
+
+# Lê uma aba da planilha (executado nos processos do pool)
+def _read_sheet(file_path, sheet_name, columns, engine):
+    usecols = (lambda column: column in columns) if columns is not None else None
+    return pd.read_excel(file_path, sheet_name, usecols=usecols, engine=engine)
+
+
+def _read_sheets_sequential(file_path, sheet_names, columns, engine):
+    return [_read_sheet(file_path, sheet_name, columns, engine) for sheet_name in sheet_names]
+
+
+def _read_sheets_parallel(file_path, sheet_names, columns, engine, max_workers):
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(_read_sheet, file_path, sheet_name, columns, engine) for sheet_name in sheet_names]
+        return [future.result() for future in futures]
+
+
+# Lê todas as abas da planilha (em paralelo quando ela é grande) e as concatena
+def read_backlog_workbook(file_path, columns=BACKLOG_COLUMNS, engine=None, max_workers=None):
+    engine = engine or default_engine()
+    with pd.ExcelFile(file_path, engine=engine) as xls:
+        sheet_names = xls.sheet_names
+
+    sheets = None
+    if len(sheet_names) > 1 and os.path.getsize(file_path) >= PARALLEL_MIN_BYTES:
+        try:
+            sheets = _read_sheets_parallel(file_path, sheet_names, columns, engine, max_workers)
+        except (BrokenProcessPool, OSError):
+            sheets = None  # ambiente sem suporte a processos: lê em sequência
+    if sheets is None:
+        sheets = _read_sheets_sequential(file_path, sheet_names, columns, engine)
+
+    backlog_data = pd.concat(sheets, ignore_index=True)
+    backlog_data = _normalize_mixed_columns(_split_date_columns(backlog_data))
+    if columns is not None:
+        backlog_data = apply_schema(backlog_data)
+    return backlog_data
+
+
+# Chave do arquivo colunar: conteúdo da planilha + colunas pedidas + versão da leitura
+def _backlog_key(file_path, columns):
+    return f"{BACKLOG_VERSION}:{file_hash(file_path)}:{'|'.join(columns) if columns is not None else '*'}"
+
+
+# Carregar e processar o arquivo backlog, reaproveitando o arquivo colunar gravado ao lado
+# da planilha (ex.: backlog.xlsx.arrow) enquanto ela não mudar. columns=None lê todas as colunas.
+def load_backlog_data(file_path, columns=BACKLOG_COLUMNS):
+    cache_path = file_path + CACHE_SUFFIX
+    key = _backlog_key(file_path, columns)
+    if os.path.exists(cache_path):
+        table = feather.read_table(cache_path, memory_map=True)
+        if (table.schema.metadata or {}).get(b'backlog_key') == key.encode('utf-8'):
+            return table.to_pandas()
+
+    backlog_data = read_backlog_workbook(file_path, columns)
+    table = pa.Table.from_pandas(backlog_data, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), b'backlog_key': key.encode('utf-8')})
+    # Temporário com nome único no mesmo diretório: duas sessões gravando juntas não se atropelam
+    with tempfile.NamedTemporaryFile(dir=os.path.dirname(os.path.abspath(cache_path)),
+                                     prefix=os.path.basename(cache_path), suffix='.tmp', delete=False) as file:
+        tmp_path = file.name
+    try:
+        feather.write_feather(table, tmp_path, compression='uncompressed')
+        os.replace(tmp_path, cache_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return backlog_data
@@ -0,0 +1,194 @@
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+
+import pandas as pd
+
+from backlog_loader import CACHE_SUFFIX, load_backlog_data
+from jira_loader import load_html_data, merge_backlog
+from jira_schema import apply_schema
+from metrics_cube import (build_cube, count_by, created_timeline, release_items_with_dates, release_items_without_dates,
+                          time_by_month, version_timeline)
+from synthetic_data import ensure_dataset
+
+DATA_DIR = 'benchmark_data'
+RESULTS_DIR = 'benchmark_results'
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+
+# Mede o tempo (melhor de 'repeat' execuções sem rastreamento) e, numa execução à parte,
+# o pico de memória alocada pelo Python/numpy com tracemalloc
+def measure(func, repeat=3, setup=None):
+    times = []
+    result = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+
+    if setup is not None:
+        setup()
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, {'seconds': min(times), 'seconds_all': times, 'peak_mb': peak / 2 ** 20}
+
+
+def _remove_sidecar(backlog_path):
+    if os.path.exists(backlog_path + CACHE_SUFFIX):
+        os.remove(backlog_path + CACHE_SUFFIX)
+
+
+# Etapas do pipeline medidas para um tamanho: carga, merge, cubo e a agregação de cada gráfico
+def run_size(issues, data_dir=DATA_DIR, repeat=3):
+    html_path, backlog_path = ensure_dataset(data_dir, issues)
+    stages = {}
+
+    jira, stages['load_html_data'] = measure(lambda: load_html_data(html_path), repeat)
+    backlog, stages['load_backlog_data'] = measure(lambda: load_backlog_data(backlog_path), repeat,
+                                                   setup=lambda: _remove_sidecar(backlog_path))
+    _, stages['load_backlog_data (sidecar)'] = measure(lambda: load_backlog_data(backlog_path), repeat)
+    jira_data, stages['merge_backlog'] = measure(lambda: apply_schema(merge_backlog(jira, backlog)), repeat)
+    cube, stages['build_cube'] = measure(lambda: build_cube(jira_data), repeat)
+
+    charts = {
+        '1 count_by Pai/Status': lambda: count_by(cube, ['Pai', 'Status']),
+        '2 count_by Responsável/Tipo': lambda: count_by(cube, ['Responsável', 'Tipo de item']),
+        '3 created_timeline': lambda: created_timeline(cube),
+        '4 time_by_month Primeira Resposta': lambda: time_by_month(cube, 'Tempo da Primeira Resposta', 'Média'),
+        '5 time_by_month Solução': lambda: time_by_month(cube, 'Tempo de Solução', 'Média'),
+        '6 release_items_without_dates': lambda: release_items_without_dates(cube),
+        '7 release_items_with_dates': lambda: release_items_with_dates(cube),
+        '8 version_timeline': lambda: version_timeline(jira_data),
+    }
+    for name, func in charts.items():
+        _, stages[f'chart {name}'] = measure(func, repeat)
+
+    return {
+        'issues': issues,
+        'html_mb': os.path.getsize(html_path) / 2 ** 20,
+        'backlog_mb': os.path.getsize(backlog_path) / 2 ** 20,
+        'rows': len(jira_data),
+        'cube_rows': len(cube),
+        'stages': stages,
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _environment():
+    import numpy
+    import pyarrow
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'pandas': pd.__version__,
+        'numpy': numpy.__version__,
+        'pyarrow': pyarrow.__version__,
+    }
+
+
+# Executa o benchmark para cada tamanho e grava o resultado em RESULTS_DIR/<data>_<commit>.json
+def run(sizes, data_dir=DATA_DIR, results_dir=RESULTS_DIR, repeat=3, label=None):
+    started = datetime.datetime.now()
+    commit = _git_commit()
+    results = {
+        'label': label,
+        'started': started.isoformat(timespec='seconds'),
+        'commit': commit,
+        'environment': _environment(),
+        'repeat': repeat,
+        'sizes': [],
+    }
+    for issues in sizes:
+        size_result = run_size(issues, data_dir, repeat)
+        results['sizes'].append(size_result)
+        print_size(size_result)
+
+    os.makedirs(results_dir, exist_ok=True)
+    name = started.strftime('%Y%m%d-%H%M%S') + (f'_{commit}' if commit else '') + '.json'
+    path = os.path.join(results_dir, name)
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2, ensure_ascii=False)
+    print(f'resultados gravados em {path}')
+    return path
+
+
+def print_size(size_result):
+    print(f"\n{size_result['issues']} itens ({size_result['html_mb']:.1f} MB de HTML, "
+          f"{size_result['cube_rows']} linhas no cubo)")
+    for stage, values in size_result['stages'].items():
+        print(f"  {stage:<40} {values['seconds'] * 1000:>10.1f} ms {values['peak_mb']:>10.1f} MB")
+
+
+def _load(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+# Compara duas execuções: razão novo/antigo do tempo e do pico de memória por etapa e tamanho
+def compare(old_path, new_path):
+    old, new = _load(old_path), _load(new_path)
+    print(f"antigo: {old['started']} ({old['commit']})  novo: {new['started']} ({new['commit']})")
+    old_sizes = {size['issues']: size for size in old['sizes']}
+    for size in new['sizes']:
+        previous = old_sizes.get(size['issues'])
+        if previous is None:
+            continue
+        print(f"\n{size['issues']} itens{'':<30} {'antigo':>10} {'novo':>10} {'tempo':>8} {'memória':>8}")
+        for stage, values in size['stages'].items():
+            before = previous['stages'].get(stage)
+            if before is None:
+                continue
+            time_ratio = values['seconds'] / before['seconds'] if before['seconds'] else float('nan')
+            memory_ratio = values['peak_mb'] / before['peak_mb'] if before['peak_mb'] else float('nan')
+            print(f"  {stage:<40} {before['seconds'] * 1000:>8.1f}ms {values['seconds'] * 1000:>8.1f}ms "
+                  f"{time_ratio:>7.2f}x {memory_ratio:>7.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark da carga e das agregações do dashboard com dados sintéticos')
+    subparsers = parser.add_subparsers(dest='command')
+
+    run_parser = subparsers.add_parser('run', help='executa o benchmark e grava os resultados')
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                            help='quantidades de itens (ex.: 1000 10000 100000 1000000)')
+    run_parser.add_argument('--repeat', type=int, default=3)
+    run_parser.add_argument('--data-dir', default=DATA_DIR)
+    run_parser.add_argument('--results-dir', default=RESULTS_DIR)
+    run_parser.add_argument('--label', help='descrição gravada junto com os resultados')
+
+    compare_parser = subparsers.add_parser('compare', help='compara dois arquivos de resultados')
+    compare_parser.add_argument('old')
+    compare_parser.add_argument('new')
+
+    args = parser.parse_args(argv)
+    if args.command == 'compare':
+        compare(args.old, args.new)
+    elif args.command == 'run':
+        run(args.sizes, args.data_dir, args.results_dir, args.repeat, args.label)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
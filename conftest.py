@@ -0,0 +1 @@
+# Os módulos ficam na raiz do repositório: este arquivo faz o pytest colocá-la no sys.path
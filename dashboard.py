@@ -1,224 +1,310 @@
 import subprocess
 import streamlit as st
 import pandas as pd
-from bs4 import BeautifulSoup
 import locale
-import plotly.express as px
+import os
+
+from backlog_join import DUPLICATE_RULE, join_report
+from backlog_loader import load_backlog_data
+from figure_budget import bound_figure
+from dashboard_figures import (figure_pai_status, figure_responsavel_item, figure_timeline, figure_time_by_month,
+                               figure_versions, figure_with_dates, figure_without_dates)
+from issue_search import IssueIndex
+from jira_store import EXPORT_SOURCES, ingest, load_store_cube, load_store_dashboard_data, segment_paths, store_version
+from metrics_cube import (count_by, created_timeline, release_items_with_dates, release_items_without_dates, slice_cube,
+                          time_by_month, version_timeline)
+from perf_metrics import PerfRecorder
+from report_pdf import report_file
+from section_cache import SECTION_CACHE_MAX_BYTES, LRUCache
+from sla_metrics import DURATION_UNITS
 
 # Configurar a página do Streamlit
 st.set_page_config(layout='wide')
 
-# Função para converter datas
-def replace_month(date_str):
-    month_map = {
-        'jan': 'Jan', 'fev': 'Feb', 'mar': 'Mar', 'abr': 'Apr', 'mai': 'May', 'jun': 'Jun',
-        'jul': 'Jul', 'ago': 'Aug', 'set': 'Sep', 'out': 'Oct', 'nov': 'Nov', 'dez': 'Dec'
-    }
-    for pt, en in month_map.items():
-        date_str = date_str.replace(pt, en)
-    return date_str
-
-# Carregar e processar o arquivo HTML
-def load_html_data(file_path):
-    with open(file_path, 'r', encoding='utf-8') as file:
-        html_content = file.read()
-
-    soup = BeautifulSoup(html_content, 'html.parser')
-    table = soup.find('table', {'id': 'issuetable'})
-    headers = [header.text.strip() for header in table.find_all('th')]
-    rows = [[cell.text.strip() for cell in row.find_all('td')] for row in table.find('tbody').find_all('tr')]
-    df = pd.DataFrame(rows, columns=headers)
-    df['Criado'] = df['Criado'].apply(replace_month)
-    df['Resolvido'] = df['Resolvido'].apply(replace_month)
-    df['[CHART] Date of First Response'] = df['[CHART] Date of First Response'].apply(replace_month)
-    df['Criado'] = pd.to_datetime(df['Criado'], format='%d/%b/%y %I:%M %p', errors='coerce')
-    df['Resolvido'] = pd.to_datetime(df['Resolvido'], format='%d/%b/%y %I:%M %p', errors='coerce')
-    df['[CHART] Date of First Response'] = pd.to_datetime(df['[CHART] Date of First Response'], format='%d/%b/%y %I:%M %p', errors='coerce')
-
-    # Filtrando registros inválidos
-    # df = df[df['Criado'].notnull() & df['Resolvido'].notnull() & (df['Resolvido'] >= df['Criado'])]
-
-    df['Tempo da Primeira Resposta'] = (df['[CHART] Date of First Response'] - df['Criado']).dt.total_seconds() / (3600 * 24)  # Convertendo para dias
-    df['Tempo da Primeira Resposta'] = df['Tempo da Primeira Resposta'].fillna(0).astype(int)  # Substituindo NaNs por 0 e convertendo para inteiros
-    df['Tempo de Solução'] = (df['Resolvido'] - df['Criado']).dt.total_seconds() / (3600 * 24)  # Convertendo para dias
-    df['Tempo de Solução'] = df['Tempo de Solução'].fillna(0).astype(int)  # Substituindo NaNs por 0 e convertendo para inteiros
-    return df
-
-# Carregar e processar o arquivo backlog
-def load_backlog_data(file_path):
-    xls = pd.ExcelFile(file_path)
-    sheets = []
-    for sheet_name in xls.sheet_names:
-        sheet = pd.read_excel(xls, sheet_name)
-        sheets.append(sheet)
-    backlog_data = pd.concat(sheets, ignore_index=True)
-    return backlog_data
-
 # Iniciar a aplicação Streamlit
 st.title('Dashboard de Análise de Dados do Jira')
 
-# Carregar os dados
-jira_data = load_html_data('Jira (3).html')
-backlog_data = load_backlog_data('backlog.xlsx')
+# Tempo, memória e linhas de cada etapa desta execução (painel "Desempenho" no fim do sidebar).
+# O pico de memória só é medido com o painel aberto, porque o tracemalloc deixa tudo mais lento.
+perf = PerfRecorder(trace_memory=st.session_state.get('painel_desempenho', False))
 
-# Combinando dados do backlog com dados do Jira
-if '#JIRA\nCard' in backlog_data.columns:
-    jira_data = jira_data.merge(backlog_data, left_on='Chave', right_on='#JIRA\nCard', how='left')
-else:
-    st.error("A coluna '#JIRA\nCard' não está presente no backlog.")
 
-# Selecionar as colunas relevantes
-df_selected = jira_data[['Pai', 'Tipo de item', 'Status', 'Responsável', 'Criado']].copy()
-df_selected['Criado'] = pd.to_datetime(df_selected['Criado'], format='%d/%b/%y %I:%M %p', errors='coerce')
+def mostrar_grafico(nome, fig, envio):
+    with perf.stage(f'{nome}: envio ao navegador', rows=envio['points']) as etapa:
+        st.plotly_chart(fig, use_container_width=True)
+        etapa['bytes'] = envio['bytes']
+    if envio['over_budget']:
+        st.caption(f"Figura acima do orçamento de envio ({envio['bytes'] / 2 ** 10:.0f} KB).")
+
+
+# Carregar os dados do armazenamento incremental (python jira_store.py ingest <exportação>).
+# Na primeira execução, o armazenamento é criado a partir das exportações de DASHBOARD_EXPORTS.
+if not segment_paths():
+    with perf.stage('carga: ingestão da exportação') as etapa:
+        etapa['rows'] = ingest(EXPORT_SOURCES)['linhas_lidas']
+# Conteúdo atual do armazenamento + backlog: chave dos dados carregados e dos caches das seções,
+# da tabela e do relatório do join
+versao_dados = store_version('backlog.xlsx')
+
+
+# Itens e cubo montados uma vez por versão dos dados e compartilhados entre as sessões, como o índice
+# de busca: as reexecuções (cada clique nos filtros) não recopiam o arquivo colunar para o pandas.
+# Os objetos são compartilhados e não devem ser alterados.
+@st.cache_resource(max_entries=2)
+def itens_dashboard(versao):
+    return load_store_dashboard_data('backlog.xlsx')
+
+
+# Cubo pré-agregado (mês, tipo, prioridade, responsável, status, pai) usado pelos gráficos
+@st.cache_resource(max_entries=2)
+def cubo_dashboard(versao):
+    return load_store_cube('backlog.xlsx')
+
+
+with perf.stage('carga: itens + backlog') as etapa:
+    jira_data = itens_dashboard(versao_dados)
+    etapa['rows'] = len(jira_data)
+with perf.stage('carga: cubo') as etapa:
+    cubo = cubo_dashboard(versao_dados)
+    etapa['rows'] = len(cubo)
+
+
+# Relatório do join memorizado: só é refeito quando o armazenamento ou a planilha mudam
+# (versão dos dados + tamanho e data de modificação do backlog), não a cada interação
+@st.cache_data(max_entries=2)
+def relatorio_backlog(versao, tamanho, modificado, _chaves):
+    return join_report(_chaves, load_backlog_data('backlog.xlsx'))
+
+
+if '#JIRA\nCard' not in jira_data.columns:
+    st.error("A coluna '#JIRA\nCard' não está presente no backlog.")
+else:
+    # Qualidade do join: cada item aparece uma vez; cards repetidos no backlog são resolvidos pela regra
+    with perf.stage('carga: relatório do join com o backlog') as etapa:
+        estado_backlog = os.stat('backlog.xlsx')
+        relatorio_join = relatorio_backlog(versao_dados, estado_backlog.st_size, estado_backlog.st_mtime_ns,
+                                           jira_data['Chave'])
+        etapa['rows'] = relatorio_join['linhas_backlog']
+    if relatorio_join['cards_duplicados'] or relatorio_join['cards_sem_item']:
+        with st.expander(f"Backlog: {len(relatorio_join['cards_duplicados'])} cards repetidos e "
+                         f"{len(relatorio_join['cards_sem_item'])} cards sem item no Jira"):
+            st.markdown(f"Cards repetidos resolvidos pela regra `{DUPLICATE_RULE}` "
+                        "(variável de ambiente DASHBOARD_BACKLOG_RULE: last, first ou most_complete).")
+            st.dataframe(pd.DataFrame(list(relatorio_join['cards_duplicados'].items()), columns=['Card', 'Linhas']),
+                         hide_index=True)
+            st.markdown('Cards do backlog sem item correspondente no Jira:')
+            st.write(', '.join(relatorio_join['cards_sem_item']))
+
+# Filtros no sidebar (opções na ordem em que aparecem nos dados; as colunas são categóricas)
+tipos_item = jira_data['Tipo de item'].unique().tolist()
+prioridades = jira_data['Prioridade'].unique().tolist()
+responsaveis = jira_data['Responsável'].unique().tolist()
 
-# Filtros no sidebar
 st.sidebar.title('Filtros')
-tipo_selecionado_sidebar = st.sidebar.multiselect('Selecione o Tipo de Item (para gráficos)',
-                                                  jira_data['Tipo de item'].unique(),
-                                                  default=jira_data['Tipo de item'].unique())
-prioridade_selecionada = st.sidebar.multiselect('Selecione a Prioridade', jira_data['Prioridade'].unique(),
-                                                default=jira_data['Prioridade'].unique())
-responsavel_selecionado = st.sidebar.multiselect('Selecione o Responsável', jira_data['Responsável'].unique(),
-                                                 default=jira_data['Responsável'].unique())
+tipo_selecionado_sidebar = st.sidebar.multiselect('Selecione o Tipo de Item (para gráficos)', tipos_item, default=tipos_item)
+prioridade_selecionada = st.sidebar.multiselect('Selecione a Prioridade', prioridades, default=prioridades)
+responsavel_selecionado = st.sidebar.multiselect('Selecione o Responsável', responsaveis, default=responsaveis)
 
 # Filtro para selecionar média ou total
 metrica_selecionada = st.sidebar.radio('Selecione a Métrica', ['Média', 'Total'])
 
-df_filtrado = jira_data[
-    (jira_data['Tipo de item'].isin(tipo_selecionado_sidebar)) &
-    (jira_data['Prioridade'].isin(prioridade_selecionada)) &
-    (jira_data['Responsável'].isin(responsavel_selecionado))]
-
-# Gráfico 1: Quantidade de itens por Tipo de Item e Status para cada Módulo
-st.markdown("### Quantidade de Itens por Tipo de Item e Status para cada Módulo")
-st.markdown("Este gráfico mostra a quantidade de itens (tarefas, bugs, melhorias, etc.) por módulo (Pai) e seu status (Status).")
-item_status_count = df_selected.groupby(['Pai', 'Status']).size().reset_index(name='Count')
-
-fig1 = px.bar(item_status_count, x='Pai', y='Count', color='Status',
-              title='Quantidade de itens por Tipo de Item e Status para cada Módulo',
-              labels={'Count': 'Quantidade de Itens', 'Pai': 'Módulo', 'Status': 'Status'},
-              text='Count')
-fig1.update_traces(texttemplate='%{text:.2s}', textposition='outside')
-st.plotly_chart(fig1, use_container_width=True)
-
-# Gráfico 2: Distribuição de Responsável por Tipo de Item
-st.markdown("### Distribuição de Responsável por Tipo de Item")
-st.markdown("Este gráfico mostra a quantidade de itens atribuídos a cada responsável, categorizados por tipo de item.")
-responsible_item_count = df_filtrado.groupby(['Responsável', 'Tipo de item']).size().reset_index(name='Count')
-
-fig2 = px.bar(responsible_item_count, x='Responsável', y='Count', color='Tipo de item',
-              title='Distribuição de Responsável por Tipo de Item',
-              labels={'Count': 'Quantidade de Itens', 'Responsável': 'Responsável', 'Tipo de item': 'Tipo de Item'},
-              text='Count')
-fig2.update_traces(texttemplate='%{text:.2s}', textposition='inside')
-st.plotly_chart(fig2, use_container_width=True)
-
-# Gráfico 3: Linha do Tempo de Itens Criados por Tipo de Item
-st.markdown("### Linha do Tempo de Itens Criados por Tipo de Item")
-st.markdown("Este gráfico mostra a quantidade de itens criados ao longo do tempo, categorizados por tipo de item.")
-df_selected = jira_data[['Pai', 'Tipo de item', 'Status', 'Responsável', 'Criado']].copy()
-df_selected['Criado'] = pd.to_datetime(df_selected['Criado'], format='%d/%b/%y %I:%M %p', errors='coerce')
-df_filtered = df_selected.dropna(subset=['Criado'])
-df_filtered['Criado'] = df_filtered['Criado'].dt.to_period('M').dt.start_time
-
-# Criar um índice com todos os meses no intervalo de datas
-all_months = pd.date_range(start=df_filtered['Criado'].min(), end=df_filtered['Criado'].max(), freq='MS')
-
-# Criar uma tabela pivô e reindexar para garantir todos os meses presentes
-df_pivot = df_filtered.groupby(['Criado', 'Tipo de item']).size().unstack(fill_value=0).reindex(all_months, fill_value=0, method=None).stack().reset_index(name='Count')
-
-# Renomear a coluna 'level_0' de volta para 'Criado'
-df_pivot = df_pivot.rename(columns={'level_0': 'Criado'})
-
-fig3 = px.line(df_pivot, x='Criado', y='Count', color='Tipo de item',
-               title='Linha do Tempo de Itens Criados por Tipo de Item',
-               labels={'Criado': 'Data', 'Count': 'Quantidade de Itens Criados', 'Tipo de item': 'Tipo de Item'},
-               text='Count')
-fig3.update_traces(texttemplate='%{text:.2s}', textposition='top center')
-fig3.update_xaxes(dtick="M1", tickformat="%b\n%Y")
-st.plotly_chart(fig3, use_container_width=True)
-
-# Gráfico 4: Tempo da Primeira Resposta por Mês
-st.markdown("### Tempo da Primeira Resposta por Mês")
-st.markdown("Este gráfico mostra o tempo da primeira resposta para itens ao longo dos meses, categorizados por tipo de item e prioridade.")
-df_filtrado['Mês'] = df_filtrado['Criado'].dt.to_period('M').astype(str)
-
-if metrica_selecionada == 'Média':
-    resposta_por_mes = df_filtrado.groupby(['Mês', 'Tipo de item', 'Prioridade'])[
-        'Tempo da Primeira Resposta'].mean().reset_index()
-    fig_resposta = px.line(resposta_por_mes, x='Mês', y='Tempo da Primeira Resposta', color='Tipo de item',
-                           title='Tempo da Primeira Resposta por Mês (Média em dias)')
-else:
-    resposta_por_mes = df_filtrado.groupby(['Mês', 'Tipo de item', 'Prioridade'])[
-        'Tempo da Primeira Resposta'].sum().reset_index()
-    fig_resposta = px.line(resposta_por_mes, x='Mês', y='Tempo da Primeira Resposta', color='Tipo de item',
-                           title='Tempo da Primeira Resposta por Mês (Total em dias)')
-st.plotly_chart(fig_resposta, use_container_width=True)
-
-# Gráfico 5: Tempo de Solução por Mês
-st.markdown("### Tempo de Solução por Mês")
-st.markdown("Este gráfico mostra o tempo de solução para itens ao longo dos meses, categorizados por tipo de item e prioridade.")
-if metrica_selecionada == 'Média':
-    solucao_por_mes = df_filtrado.groupby(['Mês', 'Tipo de item', 'Prioridade'])[
-        'Tempo de Solução'].mean().reset_index()
-    fig_solucao = px.line(solucao_por_mes, x='Mês', y='Tempo de Solução', color='Tipo de item',
-                          title='Tempo de Solução por Mês (Média em dias)')
-else:
-    solucao_por_mes = df_filtrado.groupby(['Mês', 'Tipo de item', 'Prioridade'])['Tempo de Solução'].sum().reset_index()
-    fig_solucao = px.line(solucao_por_mes, x='Mês', y='Tempo de Solução', color='Tipo de item',
-                          title='Tempo de Solução por Mês (Total em dias)')
-st.plotly_chart(fig_solucao, use_container_width=True)
-
-# Tabela de Itens Filtrados
-st.markdown("### Tabela de Itens Filtrados")
-st.markdown("Esta tabela mostra uma lista detalhada de itens filtrados por tipo de item.")
-tipo_selecionado_tabela = st.selectbox('Selecione o Tipo de Item (para tabela)', jira_data['Tipo de item'].unique())
-
-# Verificar se as colunas estão presentes antes de exibir a tabela
-colunas_tabela = ['Chave', 'Status', 'Resumo', 'Descrição', 'Análise x Documentação/Desenvolvimento/QA/Entrega', 'Responsável']
-colunas_presentes = [col for col in colunas_tabela if col in jira_data.columns]
-
-if len(colunas_presentes) < len(colunas_tabela):
-    st.warning("Algumas colunas não estão presentes nos dados combinados: " + str([col for col in colunas_tabela if col not in colunas_presentes]))
-
-df_tabela_filtrado = jira_data[jira_data['Tipo de item'] == tipo_selecionado_tabela]
-st.dataframe(df_tabela_filtrado[colunas_presentes])
-
-# Gráfico 6: Quantidade de Bugs e Melhorias sem Data Pré ou Data Produção
-st.markdown("### Quantidade de Bugs e Melhorias sem Data Pré ou Data Produção (Gráfico de Barras)")
-st.markdown("Este gráfico mostra a quantidade de bugs e melhorias que não têm datas de pré-produção ou produção ao longo dos meses.")
-df_filtrado_sem_data = df_filtrado[(df_filtrado['Tipo de item'].isin(['Bug', 'Melhoria'])) & (df_filtrado['Data Pré'].isnull()) & (df_filtrado['Data Produção'].isnull())]
-quantidade_por_mes_sem_data = df_filtrado_sem_data.groupby(['Mês', 'Tipo de item']).size().reset_index(
-    name='Quantidade')
-
-fig_barras_sem_data = px.bar(quantidade_por_mes_sem_data, x='Mês', y='Quantidade', color='Tipo de item',
-                             barmode='group',
-                             title='Quantidade de Bugs e Melhorias sem Data Pré ou Data Produção por Mês',
-                             color_discrete_map={'Melhoria': 'blue', 'Bug': 'red'})
-st.plotly_chart(fig_barras_sem_data, use_container_width=True)
-
-# Gráfico 7: Quantidade de Bugs e Melhorias com Data Pré ou Data Produção
-st.markdown("### Quantidade de Bugs e Melhorias com Data Pré ou Data Produção (Gráfico de Barras)")
-st.markdown("Este gráfico mostra a quantidade de bugs e melhorias que têm datas de pré-produção ou produção ao longo dos meses.")
-df_filtrado_data = df_filtrado[(df_filtrado['Tipo de item'].isin(['Bug', 'Melhoria'])) & (df_filtrado['Data Pré'].notnull()) | (df_filtrado['Data Produção'].notnull())]
-quantidade_por_mes_data = df_filtrado_data.groupby(['Mês', 'Tipo de item']).size().reset_index(name='Quantidade')
-
-fig_barras_data = px.bar(quantidade_por_mes_data, x='Mês', y='Quantidade', color='Tipo de item',
-                         barmode='group', title='Quantidade de Bugs e Melhorias com Data Pré ou Data Produção por Mês',
-                         color_discrete_map={'Melhoria': 'blue', 'Bug': 'red'})
-st.plotly_chart(fig_barras_data, use_container_width=True)
-
-
-# Gráfico 8: Linha do Tempo de Versões
-st.markdown("### Linha do Tempo de Versões")
-st.markdown("Este gráfico mostra a linha do tempo das versões, desde a criação até a pré-produção.")
-df_versoes = jira_data[['Versão', 'Criado', 'Data Pré']]
-df_versoes = df_versoes.dropna(subset=['Versão', 'Criado', 'Data Pré'])
-
-df_versoes['Criado'] = pd.to_datetime(df_versoes['Criado'], errors='coerce')
-df_versoes['Data Pré'] = pd.to_datetime(df_versoes['Data Pré'], errors='coerce')
-
-df_versoes = df_versoes.groupby('Versão').agg({'Criado': 'min', 'Data Pré': 'max'}).reset_index()
-
-fig_versoes = px.timeline(df_versoes, x_start='Criado', x_end='Data Pré', y='Versão', title='Linha do Tempo das Versões')
-st.plotly_chart(fig_versoes, use_container_width=True)
+# Unidade dos tempos: dias corridos ou horas úteis (expediente, fins de semana e feriados)
+unidade_selecionada = st.sidebar.radio('Unidade dos Tempos', list(DURATION_UNITS))
+rotulo_unidade, (medida_resposta, medida_solucao) = DURATION_UNITS[unidade_selecionada]
+
+# Seleção dos filtros como chave do cache das seções (a ordem da seleção não muda o resultado)
+def chave_filtro(selecionados):
+    return tuple(sorted(str(valor) for valor in selecionados))
+
+
+filtros = (chave_filtro(tipo_selecionado_sidebar), chave_filtro(prioridade_selecionada), chave_filtro(responsavel_selecionado))
+
+
+# Agregados e figuras memorizados em um LRU com limite de memória, compartilhado entre as sessões
+@st.cache_resource
+def cache_secoes():
+    return LRUCache(SECTION_CACHE_MAX_BYTES)
+
+
+cache = cache_secoes()
+
+
+# Os filtros recortam o cubo em vez de percorrer todos os itens. O recorte é feito uma vez por execução,
+# na primeira vez em que algum gráfico precisa recalcular, e reaproveitado pelos demais.
+recorte_filtros = {}
+
+
+def cubo_filtrado():
+    if 'cubo' not in recorte_filtros:
+        with perf.stage('filtros: recorte do cubo') as etapa:
+            recorte_filtros['cubo'] = slice_cube(cubo, tipo_selecionado_sidebar, prioridade_selecionada,
+                                                 responsavel_selecionado)
+            etapa['rows'] = len(recorte_filtros['cubo'])
+    return recorte_filtros['cubo']
+
+
+# Mostra um gráfico, reaproveitando agregado e figura já calculados para os mesmos dados e filtros.
+# chave: só as entradas de que o gráfico depende (filtros e/ou métrica); base: os dados que a agregação
+# recebe (cubo inteiro por padrão), obtidos antes da etapa da agregação para as etapas não se aninharem
+def grafico(nome, chave, agregar, desenhar, base=lambda: cubo):
+    chave = (nome, versao_dados) + chave
+    memorizado = cache.get(chave)
+    if memorizado is None:
+        dados_base = base()
+        with perf.stage(f'{nome}: agregação') as etapa:
+            dados = agregar(dados_base)
+            etapa['rows'] = len(dados)
+        with perf.stage(f'{nome}: figura'):
+            # Orçamento de envio: WebGL para muitos pontos e redução das linhas se o JSON passar do limite
+            fig, envio = bound_figure(desenhar(dados))
+        cache.put(chave, (dados, fig, envio))
+    else:
+        with perf.stage(f'{nome}: cache') as etapa:
+            dados, fig, envio = memorizado
+            etapa['rows'] = len(dados)
+    mostrar_grafico(nome, fig, envio)
+
+
+# Cada seção é calculada e enviada só quando está selecionada
+SECOES = ['Itens', 'Tempos', 'Datas e Versões', 'Tabela']
+secao = st.radio('Seção', SECOES, horizontal=True, key='secao')
+
+if secao == 'Itens':
+    # Gráfico 1: Quantidade de itens por Tipo de Item e Status para cada Módulo
+    st.markdown("### Quantidade de Itens por Tipo de Item e Status para cada Módulo")
+    st.markdown("Este gráfico mostra a quantidade de itens (tarefas, bugs, melhorias, etc.) por módulo (Pai) e seu status (Status).")
+    grafico('gráfico 1', (), lambda dados: count_by(dados, ['Pai', 'Status']), figure_pai_status)
+
+    # Gráfico 2: Distribuição de Responsável por Tipo de Item
+    st.markdown("### Distribuição de Responsável por Tipo de Item")
+    st.markdown("Este gráfico mostra a quantidade de itens atribuídos a cada responsável, categorizados por tipo de item.")
+    grafico('gráfico 2', filtros, lambda dados: count_by(dados, ['Responsável', 'Tipo de item']),
+            figure_responsavel_item, cubo_filtrado)
+
+    # Gráfico 3: Linha do Tempo de Itens Criados por Tipo de Item
+    st.markdown("### Linha do Tempo de Itens Criados por Tipo de Item")
+    st.markdown("Este gráfico mostra a quantidade de itens criados ao longo do tempo, categorizados por tipo de item.")
+    grafico('gráfico 3', (), created_timeline, figure_timeline)
+
+elif secao == 'Tempos':
+    # Gráfico 4: Tempo da Primeira Resposta por Mês
+    st.markdown("### Tempo da Primeira Resposta por Mês")
+    st.markdown("Este gráfico mostra o tempo da primeira resposta para itens ao longo dos meses, categorizados por tipo de item. "
+                "Itens ainda sem resposta não entram na média.")
+    grafico('gráfico 4', filtros + (metrica_selecionada, unidade_selecionada),
+            lambda dados: time_by_month(dados, medida_resposta, metrica_selecionada),
+            lambda dados: figure_time_by_month(dados, medida_resposta, metrica_selecionada, rotulo_unidade), cubo_filtrado)
+
+    # Gráfico 5: Tempo de Solução por Mês
+    st.markdown("### Tempo de Solução por Mês")
+    st.markdown("Este gráfico mostra o tempo de solução para itens ao longo dos meses, categorizados por tipo de item. "
+                "Itens não resolvidos não entram na média.")
+    grafico('gráfico 5', filtros + (metrica_selecionada, unidade_selecionada),
+            lambda dados: time_by_month(dados, medida_solucao, metrica_selecionada),
+            lambda dados: figure_time_by_month(dados, medida_solucao, metrica_selecionada, rotulo_unidade), cubo_filtrado)
+
+elif secao == 'Datas e Versões':
+    # Gráfico 6: Quantidade de Bugs e Melhorias sem Data Pré ou Data Produção
+    st.markdown("### Quantidade de Bugs e Melhorias sem Data Pré ou Data Produção (Gráfico de Barras)")
+    st.markdown("Este gráfico mostra a quantidade de bugs e melhorias que não têm datas de pré-produção ou produção ao longo dos meses.")
+    grafico('gráfico 6', filtros, release_items_without_dates, figure_without_dates, cubo_filtrado)
+
+    # Gráfico 7: Quantidade de Bugs e Melhorias com Data Pré ou Data Produção
+    st.markdown("### Quantidade de Bugs e Melhorias com Data Pré ou Data Produção (Gráfico de Barras)")
+    st.markdown("Este gráfico mostra a quantidade de bugs e melhorias que têm datas de pré-produção ou produção ao longo dos meses.")
+    grafico('gráfico 7', filtros, release_items_with_dates, figure_with_dates, cubo_filtrado)
+
+    # Gráfico 8: Linha do Tempo de Versões
+    st.markdown("### Linha do Tempo de Versões")
+    st.markdown("Este gráfico mostra a linha do tempo das versões, desde a criação até a pré-produção.")
+    grafico('gráfico 8', (), version_timeline, figure_versions, lambda: jira_data)
+
+
+# Índice de busca dos itens (Chave, Resumo, Descrição), montado uma vez por versão dos dados
+@st.cache_resource(max_entries=2)
+def indice_itens(versao, _itens):
+    return IssueIndex(_itens)
+
+
+# Busca, filtro, ordenação ou tamanho da página mudaram: volta para a primeira página
+def primeira_pagina():
+    st.session_state['pagina_tabela'] = 1
+
+
+# Tabela de Itens Filtrados, paginada no servidor: busca, filtro, ordenação e projeção das colunas
+# acontecem antes do envio, e só a página atual vai para o navegador. Em um fragmento: mudar a
+# busca ou a página reexecuta só a tabela.
+@st.experimental_fragment
+def secao_tabela():
+    st.markdown("### Tabela de Itens Filtrados")
+    st.markdown("Esta tabela mostra uma lista detalhada de itens filtrados por tipo de item.")
+    tipo_selecionado_tabela = st.selectbox('Selecione o Tipo de Item (para tabela)', tipos_item, key='tipo_tabela', on_change=primeira_pagina)
+
+    # Verificar se as colunas estão presentes antes de exibir a tabela
+    colunas_tabela = ['Chave', 'Status', 'Resumo', 'Descrição', 'Análise x Documentação/Desenvolvimento/QA/Entrega', 'Responsável']
+    colunas_presentes = [col for col in colunas_tabela if col in jira_data.columns]
+
+    if len(colunas_presentes) < len(colunas_tabela):
+        st.warning("Algumas colunas não estão presentes nos dados combinados: " + str([col for col in colunas_tabela if col not in colunas_presentes]))
+
+    with perf.stage('tabela: índice de busca') as etapa:
+        indice = indice_itens(versao_dados, jira_data)
+        etapa['rows'] = indice.rows
+
+    busca = st.text_input('Buscar por Chave, Resumo ou Descrição', key='busca_tabela', on_change=primeira_pagina)
+    coluna_busca, coluna_ordem, coluna_tamanho = st.columns([2, 1, 1])
+    ordenar_por = coluna_busca.selectbox('Ordenar por', indice.sort_columns, key='ordem_tabela', on_change=primeira_pagina)
+    decrescente = coluna_ordem.toggle('Decrescente', key='decrescente_tabela', on_change=primeira_pagina)
+    tamanho_pagina = coluna_tamanho.selectbox('Itens por página', [25, 50, 100], index=1, key='tamanho_pagina', on_change=primeira_pagina)
+    pagina = st.session_state.get('pagina_tabela', 1)
+
+    with perf.stage('tabela: busca e página') as etapa:
+        df_pagina, total = indice.page(busca, {'Tipo de item': tipo_selecionado_tabela}, ordenar_por, not decrescente,
+                                       pagina - 1, tamanho_pagina, colunas_presentes)
+        paginas = max((total + tamanho_pagina - 1) // tamanho_pagina, 1)
+        if pagina > paginas:
+            # A busca ou o filtro diminuíram o total: volta para a última página existente
+            pagina = st.session_state['pagina_tabela'] = paginas
+            df_pagina, total = indice.page(busca, {'Tipo de item': tipo_selecionado_tabela}, ordenar_por,
+                                           not decrescente, pagina - 1, tamanho_pagina, colunas_presentes)
+        etapa['rows'] = total
+    with perf.stage('tabela: envio ao navegador'):
+        st.dataframe(df_pagina, hide_index=True)
+    st.number_input(f'Página (de {paginas}) — {total} itens encontrados', min_value=1, max_value=paginas,
+                    key='pagina_tabela')
+
+
+if secao == 'Tabela':
+    secao_tabela()
+
+# Relatório PDF com todos os gráficos e a tabela, montado a partir do cubo e dos itens já carregados
+st.sidebar.title('Relatório')
+if st.sidebar.button("Gerar PDF"):
+    # O PDF é gravado em um arquivo temporário (tabela limitada a REPORT_TABLE_MAX_ROWS linhas), entregue
+    # ao botão de download e removido em seguida
+    with perf.stage('relatório PDF'):
+        caminho_pdf = report_file(cubo, jira_data, tipos=tipo_selecionado_sidebar, prioridades=prioridade_selecionada,
+                                  responsaveis=responsavel_selecionado, metrica=metrica_selecionada,
+                                  tipo_tabela=st.session_state.get('tipo_tabela', tipos_item[0]),
+                                  unidade=unidade_selecionada)
+    try:
+        with open(caminho_pdf, 'rb') as arquivo_pdf:
+            st.sidebar.download_button(label="Baixar PDF", data=arquivo_pdf, file_name="relatorio.pdf",
+                                       mime="application/pdf")
+    finally:
+        os.remove(caminho_pdf)
+
+# Métricas desta execução: histórico em perf/metrics.jsonl e última execução em perf/dashboard.prom
+perf.write()
+st.sidebar.title('Desempenho')
+if st.sidebar.checkbox('Mostrar painel de desempenho', key='painel_desempenho'):
+    st.sidebar.metric('Tempo total da execução', f'{perf.total_seconds():.2f} s')
+    etapas = perf.to_frame().rename(columns={'stage': 'Etapa', 'seconds': 'Tempo (s)', 'peak_mb': 'Pico (MB)',
+                                             'rows': 'Linhas/pontos', 'bytes': 'Bytes enviados',
+                                             'rss_mb': 'RSS do processo (MB)'})
+    st.sidebar.dataframe(etapas, hide_index=True)
+    st.sidebar.caption('O pico de memória é medido com tracemalloc enquanto o painel está aberto.')
+    estatisticas = cache.stats()
+    st.sidebar.caption(f"Cache das seções: {estatisticas['entradas']} entradas, "
+                       f"{estatisticas['bytes'] / 2 ** 20:.1f} de {estatisticas['limite'] / 2 ** 20:.0f} MB, "
+                       f"{estatisticas['acertos']} acertos e {estatisticas['faltas']} faltas")
\ No newline at end of file
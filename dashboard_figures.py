@@ -0,0 +1,69 @@
+import os
+
+import plotly.express as px
+
+RELEASE_COLORS = {'Melhoria': 'blue', 'Bug': 'red'}
+
+# Linha do tempo de versões: só as versões com Data Pré mais recente (uma barra por versão)
+MAX_TIMELINE_VERSIONS = int(os.environ.get('DASHBOARD_MAX_TIMELINE_VERSIONS', 60))
+
+
+# Gráfico 1: Quantidade de itens por Tipo de Item e Status para cada Módulo
+def figure_pai_status(item_status_count):
+    fig1 = px.bar(item_status_count, x='Pai', y='Count', color='Status',
+                  title='Quantidade de itens por Tipo de Item e Status para cada Módulo',
+                  labels={'Count': 'Quantidade de Itens', 'Pai': 'Módulo', 'Status': 'Status'},
+                  text='Count')
+    fig1.update_traces(texttemplate='%{text:.2s}', textposition='outside')
+    return fig1
+
+
+# Gráfico 2: Distribuição de Responsável por Tipo de Item
+def figure_responsavel_item(responsible_item_count):
+    fig2 = px.bar(responsible_item_count, x='Responsável', y='Count', color='Tipo de item',
+                  title='Distribuição de Responsável por Tipo de Item',
+                  labels={'Count': 'Quantidade de Itens', 'Responsável': 'Responsável', 'Tipo de item': 'Tipo de Item'},
+                  text='Count')
+    fig2.update_traces(texttemplate='%{text:.2s}', textposition='inside')
+    return fig2
+
+
+# Gráfico 3: Linha do Tempo de Itens Criados por Tipo de Item
+def figure_timeline(df_pivot):
+    fig3 = px.line(df_pivot, x='Criado', y='Count', color='Tipo de item',
+                   title='Linha do Tempo de Itens Criados por Tipo de Item',
+                   labels={'Criado': 'Data', 'Count': 'Quantidade de Itens Criados', 'Tipo de item': 'Tipo de Item'},
+                   text='Count')
+    fig3.update_traces(texttemplate='%{text:.2s}', textposition='top center')
+    fig3.update_xaxes(dtick="M1", tickformat="%b\n%Y")
+    return fig3
+
+
+# Gráficos 4 e 5: tempo (média ou total, em dias ou horas úteis) por mês
+def figure_time_by_month(data, measure, metric, unit='dias'):
+    sufixo = f'Média em {unit}' if metric == 'Média' else f'Total em {unit}'
+    return px.line(data, x='Mês', y=measure, color='Tipo de item', title=f'{measure} por Mês ({sufixo})')
+
+
+# Gráfico 6: Quantidade de Bugs e Melhorias sem Data Pré ou Data Produção
+def figure_without_dates(quantidade_por_mes_sem_data):
+    return px.bar(quantidade_por_mes_sem_data, x='Mês', y='Quantidade', color='Tipo de item',
+                  barmode='group',
+                  title='Quantidade de Bugs e Melhorias sem Data Pré ou Data Produção por Mês',
+                  color_discrete_map=RELEASE_COLORS)
+
+
+# Gráfico 7: Quantidade de Bugs e Melhorias com Data Pré ou Data Produção
+def figure_with_dates(quantidade_por_mes_data):
+    return px.bar(quantidade_por_mes_data, x='Mês', y='Quantidade', color='Tipo de item',
+                  barmode='group', title='Quantidade de Bugs e Melhorias com Data Pré ou Data Produção por Mês',
+                  color_discrete_map=RELEASE_COLORS)
+
+
+# Gráfico 8: Linha do Tempo de Versões
+def figure_versions(df_versoes, max_versions=MAX_TIMELINE_VERSIONS):
+    title = 'Linha do Tempo das Versões'
+    if len(df_versoes) > max_versions:
+        df_versoes = df_versoes.nlargest(max_versions, 'Data Pré').sort_index()
+        title += f' (as {max_versions} mais recentes)'
+    return px.timeline(df_versoes, x_start='Criado', x_end='Data Pré', y='Versão', title=title)
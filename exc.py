@@ -1,25 +1,10 @@
 import matplotlib.pyplot as plt
 import seaborn as sns
-import pandas as pd
-from bs4 import BeautifulSoup
 
-def extract_table_from_html(html_file):
-    with open(html_file, 'r', encoding='utf-8') as file:
-        html_content = file.read()
-
-    soup = BeautifulSoup(html_content, 'html.parser')
-
-    table = soup.find('table', {'id': 'issuetable'})
-    headers = [header.text.strip() for header in table.find_all('th')]
+from jira_html import read_issuetable
 
-    rows = []
-    for row in table.find('tbody').find_all('tr'):
-        cells = row.find_all('td')
-        row_data = [cell.text.strip() for cell in cells]
-        rows.append(row_data)
-
-    df = pd.DataFrame(rows, columns=headers)
-    return df
+def extract_table_from_html(html_file):
+    return read_issuetable(html_file, columns=['Pai', 'Tipo de item'])
 
 def prepare_dataframe(df):
     df_selected = df[['Pai', 'Tipo de item']].copy()
@@ -0,0 +1,107 @@
+import os
+
+import numpy as np
+import plotly.graph_objects as go
+
+# Tamanho máximo do JSON de cada figura enviada ao navegador
+FIGURE_BUDGET_BYTES = int(os.environ.get('DASHBOARD_FIGURE_BUDGET_KB', 512)) * 2 ** 10
+
+# Acima desta quantidade de pontos, as linhas passam a usar WebGL (scattergl)
+WEBGL_MIN_POINTS = int(os.environ.get('DASHBOARD_WEBGL_MIN_POINTS', 1000))
+
+# Atributos por ponto de um trace, reduzidos junto com x e y
+POINT_ATTRIBUTES = ['x', 'y', 'text', 'hovertext', 'customdata']
+
+
+def figure_bytes(fig):
+    return len(fig.to_json().encode('utf-8'))
+
+
+def _points(trace):
+    return len(trace.x) if trace.x is not None else (len(trace.y) if trace.y is not None else 0)
+
+
+def count_points(fig):
+    return sum(_points(trace) for trace in fig.data)
+
+
+# Linhas (scatter) com muitos pontos viram scattergl: o navegador desenha com WebGL em vez de SVG
+def to_webgl(fig, min_points=WEBGL_MIN_POINTS):
+    if count_points(fig) < min_points:
+        return fig, False
+    converted = False
+    traces = []
+    for trace in fig.data:
+        if trace.type == 'scatter':
+            properties = trace.to_plotly_json()
+            properties.pop('type', None)
+            traces.append(go.Scattergl(properties))
+            converted = True
+        else:
+            traces.append(trace)
+    if converted:
+        fig = go.Figure(data=traces, layout=fig.layout)
+    return fig, converted
+
+
+# Posições mantidas ao reduzir uma série a ~max_points pontos: primeiro, último e, em cada
+# intervalo, o menor e o maior valor de y (os picos continuam visíveis)
+def downsample_positions(y, max_points):
+    count = len(y)
+    if count <= max_points or max_points < 4:
+        return np.arange(min(count, max(max_points, 0)))
+    values = np.asarray(y, dtype=float)
+    values = np.where(np.isnan(values), 0, values)
+    buckets = np.array_split(np.arange(1, count - 1), max(max_points // 2 - 1, 1))
+    positions = [0, count - 1]
+    for bucket in buckets:
+        if len(bucket):
+            positions.append(bucket[np.argmin(values[bucket])])
+            positions.append(bucket[np.argmax(values[bucket])])
+    return np.unique(positions)
+
+
+def _downsample_trace(trace, max_points):
+    if trace.type not in ('scatter', 'scattergl') or _points(trace) <= max_points:
+        return False
+    y = trace.y if trace.y is not None else np.zeros(_points(trace))
+    positions = downsample_positions(y, max_points)
+    count = _points(trace)
+    updates = {}
+    for attribute in POINT_ATTRIBUTES:
+        values = getattr(trace, attribute, None)
+        if values is not None and not isinstance(values, str) and len(values) == count:
+            updates[attribute] = np.asarray(values, dtype=object if attribute != 'y' else None)[positions]
+    trace.update(updates)
+    return True
+
+
+# Aplica o orçamento de tamanho a uma figura: WebGL acima do limite de pontos e, se o JSON ainda
+# passar do orçamento, reduz os pontos das linhas proporcionalmente (até 4 tentativas).
+# Retorna a figura e um resumo (bytes, pontos, webgl, reduzida) para o painel de desempenho.
+def bound_figure(fig, budget=FIGURE_BUDGET_BYTES, webgl_min_points=WEBGL_MIN_POINTS):
+    original_points = count_points(fig)
+    fig, _ = to_webgl(fig, webgl_min_points)
+    webgl = any(trace.type == 'scattergl' for trace in fig.data)
+    size = figure_bytes(fig)
+    reduced = False
+    for _ in range(4):
+        if size <= budget:
+            break
+        points = count_points(fig)
+        if not points:
+            break
+        factor = max((budget * 0.9) / size, 0.05)
+        changed = False
+        for trace in fig.data:
+            changed |= _downsample_trace(trace, max(int(_points(trace) * factor), 4))
+        if not changed:
+            break
+        reduced = True
+        size = figure_bytes(fig)
+    if reduced:
+        fig.add_annotation(text=f'Gráfico reduzido para o envio ({count_points(fig)} de {original_points} pontos)',
+                           xref='paper', yref='paper', x=1, y=1.08, showarrow=False, font={'size': 10})
+        size = figure_bytes(fig)
+    return fig, {'bytes': size, 'points': count_points(fig), 'original_points': original_points, 'webgl': webgl,
+                 'reduced': reduced, 'over_budget': size > budget}
@@ -1,25 +1,153 @@
-import pandas as pd
-from bs4 import BeautifulSoup
-
-# Load the HTML file
-with open('Jira (3).html', 'r', encoding='utf-8') as file:
-    html_content = file.read()
-
-# Parse the HTML content using BeautifulSoup
-soup = BeautifulSoup(html_content, 'html.parser')
-
-# Extract the table headers
-table = soup.find('table', {'id': 'issuetable'})
-headers = [header.text.strip() for header in table.find_all('th')]
-
-# Extract the table rows
-rows = []
-for row in table.find('tbody').find_all('tr'):
-    cells = row.find_all('td')
-    row_data = [cell.text.strip() for cell in cells]
-    rows.append(row_data)
-
-# Create a DataFrame from the extracted data
-df = pd.DataFrame(rows, columns=headers)
-csv_path_utf8 = 'Jira_Issues_Export_Semicolon_UTF8.csv'
-df.to_csv(csv_path_utf8, index=False, sep=';', encoding='utf-8-sig')
+import os
+import time
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from jira_dates import DATE_COLUMNS, convert_date_columns
+from jira_html import DATAFRAME_CHUNK_ROWS, iter_issuetable_chunks
+
+# Formatos de saída e a extensão de cada um
+FORMATS = {'csv': '.csv', 'parquet': '.parquet', 'jsonl': '.jsonl'}
+
+# Saída padrão (a mesma do script original)
+DEFAULT_INPUT = 'Jira (3).html'
+DEFAULT_OUTPUT = 'Jira_Issues_Export_Semicolon_UTF8.csv'
+
+# Intervalo entre as verificações do diretório no modo watch (em segundos)
+WATCH_INTERVAL = float(os.environ.get('DASHBOARD_WATCH_INTERVAL', 5))
+
+
+# Formato pela extensão do arquivo de saída (csv quando não reconhecida)
+def format_for(output_path):
+    extension = os.path.splitext(output_path)[1].lower()
+    return next((name for name, suffix in FORMATS.items() if suffix == extension), 'csv')
+
+
+def output_path_for(input_path, fmt, output_dir=None):
+    name = os.path.splitext(os.path.basename(input_path))[0] + FORMATS[fmt]
+    return os.path.join(output_dir or os.path.dirname(input_path), name)
+
+
+# Esquema fixo do Parquet: texto em todas as colunas e timestamp nas datas convertidas.
+# Definido no primeiro bloco para que um bloco só com datas vazias não mude o tipo da coluna.
+def _parquet_schema(chunk, typed_dates):
+    dates = DATE_COLUMNS if typed_dates else []
+    return pa.schema([(column, pa.timestamp('ns') if column in dates else pa.large_string())
+                      for column in chunk.columns])
+
+
+# Escreve os blocos de uma exportação em CSV (';', UTF-8 com BOM), Parquet ou JSON Lines
+def _write_chunks(chunks, file, fmt, typed_dates):
+    rows = 0
+    writer = None
+    for chunk in chunks:
+        if typed_dates:
+            chunk = convert_date_columns(chunk)
+        if fmt == 'csv':
+            chunk.to_csv(file, sep=';', index=False, header=rows == 0, date_format='%Y-%m-%d %H:%M:%S')
+        elif fmt == 'jsonl':
+            if len(chunk):
+                chunk.to_json(file, orient='records', lines=True, force_ascii=False, date_format='iso')
+        else:
+            if writer is None:
+                writer = pq.ParquetWriter(file, _parquet_schema(chunk, typed_dates))
+            writer.write_table(pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False))
+        rows += len(chunk)
+    if writer is not None:
+        writer.close()
+    return rows
+
+
+# Converte uma exportação HTML do Jira bloco a bloco (chunk_rows linhas por vez), sem montar o
+# DataFrame inteiro: a memória usada não depende do tamanho do arquivo.
+# columns projeta as colunas na leitura; typed_dates converte as colunas de data do Jira.
+# A saída é gravada em um arquivo temporário e só substitui o destino ao final.
+def convert_export(input_path, output_path, fmt=None, columns=None, typed_dates=False,
+                   chunk_rows=DATAFRAME_CHUNK_ROWS):
+    fmt = fmt or format_for(output_path)
+    start = time.perf_counter()
+    chunks = iter_issuetable_chunks(input_path, chunk_rows, columns)
+    tmp_path = output_path + '.tmp'
+    try:
+        if fmt == 'parquet':
+            with open(tmp_path, 'wb') as file:
+                rows = _write_chunks(chunks, file, fmt, typed_dates)
+        else:
+            with open(tmp_path, 'w', encoding='utf-8-sig' if fmt == 'csv' else 'utf-8', newline='') as file:
+                rows = _write_chunks(chunks, file, fmt, typed_dates)
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return {'arquivo': input_path, 'saida': output_path, 'formato': fmt, 'linhas': rows,
+            'segundos': round(time.perf_counter() - start, 3)}
+
+
+# Converte as exportações novas que chegam em um diretório. Um arquivo só é convertido quando o
+# tamanho e a data de modificação se repetem entre duas verificações (cópia terminada) e a saída
+# não existe ou é mais antiga que ele. Um erro em um arquivo é registrado e não interrompe o
+# monitoramento; um arquivo inválido só é tentado de novo quando mudar (OSError tenta de novo).
+def watch(input_dir, fmt='csv', output_dir=None, columns=None, typed_dates=False, chunk_rows=DATAFRAME_CHUNK_ROWS,
+          interval=WATCH_INTERVAL, iterations=None):
+    seen = {}
+    failed = {}
+    while iterations is None or iterations > 0:
+        for name in sorted(os.listdir(input_dir)):
+            input_path = os.path.join(input_dir, name)
+            if not name.lower().endswith(('.html', '.htm')) or not os.path.isfile(input_path):
+                continue
+            try:
+                stat = os.stat(input_path)
+            except OSError:
+                continue  # removido entre a listagem e a verificação
+            state = (stat.st_size, stat.st_mtime)
+            previous, seen[input_path] = seen.get(input_path), state
+            output_path = output_path_for(input_path, fmt, output_dir)
+            if os.path.exists(output_path) and os.path.getmtime(output_path) >= stat.st_mtime:
+                continue
+            if previous != state or failed.get(input_path) == state:
+                continue
+            try:
+                print(convert_export(input_path, output_path, fmt, columns, typed_dates, chunk_rows), flush=True)
+                failed.pop(input_path, None)
+            except OSError as error:
+                print(f'erro: {input_path}: {error}', flush=True)
+            except Exception as error:
+                failed[input_path] = state
+                print(f'erro: {input_path}: {type(error).__name__}: {error}', flush=True)
+        if iterations is not None:
+            iterations -= 1
+            if not iterations:
+                break
+        time.sleep(interval)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Converte exportações HTML do Jira para CSV, Parquet ou JSON Lines')
+    parser.add_argument('entradas', nargs='*', default=[DEFAULT_INPUT], help='exportações HTML do Jira')
+    parser.add_argument('--output', help='arquivo de saída (só com uma entrada)')
+    parser.add_argument('--output-dir', help='diretório de saída (padrão: o da entrada)')
+    parser.add_argument('--format', choices=list(FORMATS), help='formato de saída (padrão: pela extensão da saída)')
+    parser.add_argument('--columns', help='colunas mantidas, separadas por vírgula (padrão: todas)')
+    parser.add_argument('--typed-dates', action='store_true', help='converte as colunas de data do Jira')
+    parser.add_argument('--chunk-rows', type=int, default=DATAFRAME_CHUNK_ROWS, help='linhas por bloco')
+    parser.add_argument('--watch', metavar='DIRETORIO', help='converte as exportações que chegarem no diretório')
+    parser.add_argument('--interval', type=float, default=WATCH_INTERVAL, help='segundos entre as verificações')
+    args = parser.parse_args()
+    colunas = [coluna.strip() for coluna in args.columns.split(',')] if args.columns else None
+
+    if args.watch:
+        watch(args.watch, args.format or 'csv', args.output_dir, colunas, args.typed_dates, args.chunk_rows,
+              args.interval)
+    elif args.output or args.entradas == [DEFAULT_INPUT] and not (args.format or args.output_dir):
+        if len(args.entradas) > 1:
+            parser.error('--output só pode ser usado com uma entrada')
+        print(convert_export(args.entradas[0], args.output or DEFAULT_OUTPUT, args.format, colunas, args.typed_dates,
+                             args.chunk_rows))
+    else:
+        for entrada in args.entradas:
+            formato = args.format or 'csv'
+            print(convert_export(entrada, output_path_for(entrada, formato, args.output_dir), formato, colunas,
+                                 args.typed_dates, args.chunk_rows))
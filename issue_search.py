@@ -0,0 +1,142 @@
+import time
+import unicodedata
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Colunas indexadas para a busca textual da tabela de itens
+SEARCH_COLUMNS = ['Chave', 'Resumo', 'Descrição']
+
+# Colunas pelas quais a tabela pode ser ordenada (a ordem de cada uma é calculada uma vez)
+SORT_COLUMNS = ['Chave', 'Status', 'Resumo', 'Responsável', 'Criado', 'Atualizado(a)', 'Prioridade']
+
+# Palavras são sequências de letras, dígitos e hífen (chaves como 'OABDRJ-91' ficam inteiras).
+# Depois da decomposição NFKD, os bytes não ASCII (acentos) são removidos e os demais viram espaço.
+_WORD_BYTES = b'0123456789abcdefghijklmnopqrstuvwxyz-\x00'
+_TRANSLATE = bytes(byte if byte in _WORD_BYTES else ord(' ') for byte in range(256))
+_NON_ASCII = bytes(range(128, 256))
+_SEPARATOR = ' \x00 '
+
+
+# Texto em minúsculas, sem acentos ('Solução' -> 'solucao') e só com bytes de palavras
+def fold_text(text):
+    return unicodedata.normalize('NFKD', text.lower()).encode('utf-8').translate(_TRANSLATE, _NON_ASCII)
+
+
+# Palavras de uma consulta
+def tokenize(text):
+    return [token.decode('ascii') for token in fold_text(text).split()]
+
+
+# Palavras de todas as linhas sem criar objetos Python por palavra: minúsculas e NFKD no pyarrow,
+# as linhas viram um único texto com um separador entre elas (o buffer do array), que é limpo com
+# bytes.translate, dividido e codificado em dicionário. A linha de cada palavra sai da contagem de
+# separadores. Retorna (linha de cada palavra, código de cada palavra, vocabulário ordenado).
+def _tokenize_rows(columns):
+    arrays = [pc.fill_null(pa.array(column.astype(object), type=pa.large_string(), from_pandas=True), '')
+              for column in columns]
+    text = pc.utf8_normalize(pc.utf8_lower(pc.binary_join_element_wise(*arrays, pa.scalar(' ', pa.large_string()))), form='NFKD')
+    text = pc.binary_join_element_wise(text, pa.scalar('', pa.large_string()), pa.scalar(_SEPARATOR, pa.large_string()))
+    offsets = np.frombuffer(text.buffers()[1], dtype=np.int64)[text.offset:text.offset + len(text) + 1]
+    joined = text.buffers()[2].to_pybytes()[offsets[0]:offsets[-1]].translate(_TRANSLATE, _NON_ASCII)
+
+    tokens = pc.list_flatten(pc.ascii_split_whitespace(pa.array([joined.decode('ascii')], type=pa.large_string())))
+    encoded = pc.dictionary_encode(tokens)
+    order = pc.array_sort_indices(encoded.dictionary).to_numpy()
+    ranks = np.empty(len(order), dtype=np.int64)
+    ranks[order] = np.arange(len(order))
+    codes = ranks[encoded.indices.to_numpy()]
+    vocabulary = encoded.dictionary.take(pa.array(order)).to_numpy(zero_copy_only=False)
+
+    # Vocabulário ordenado: '' (sobras da divisão) e o separador, se existirem, ficam no início
+    special = int(len(vocabulary) > 0 and vocabulary[0] == '')
+    separator = special
+    special += 1
+    separators = codes == separator
+    rows = np.cumsum(separators)[codes >= special]
+    return rows, codes[codes >= special] - special, vocabulary[special:]
+
+
+# Ordem natural das chaves: pelo projeto e depois pelo número ('OABDRJ-9' antes de 'OABDRJ-10'),
+# nulos no fim. Chaves sem número ficam depois das numeradas do mesmo projeto.
+def _key_order(values, ascending):
+    parts = pd.Series(values.to_numpy(dtype=object)).astype('string').str.extract(r'^(.*?)(?:-(\d+))?$')
+    keys = pd.DataFrame({'projeto': parts[0], 'numero': pd.to_numeric(parts[1])})
+    return keys.sort_values(['projeto', 'numero'], ascending=ascending, na_position='last', kind='stable').index.to_numpy()
+
+
+# Índice invertido (palavra -> posições das linhas) sobre Chave, Resumo e Descrição, montado uma vez
+# por versão dos dados. A consulta é a interseção das listas de cada palavra; a última palavra
+# vale como prefixo, para a busca funcionar enquanto se digita.
+class IssueIndex:
+    def __init__(self, df, search_columns=SEARCH_COLUMNS, sort_columns=SORT_COLUMNS):
+        start = time.perf_counter()
+        self.df = df
+        self.rows = len(df)
+        columns = [df[column] for column in search_columns if column in df.columns]
+        if columns and self.rows:
+            rows, codes, vocabulary = _tokenize_rows(columns)
+        else:
+            rows, codes, vocabulary = np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), []
+        # Pares (palavra, linha) sem repetição, ordenados por palavra: as linhas de cada palavra ficam contíguas
+        pairs = np.unique(codes.astype(np.int64) * max(self.rows, 1) + rows)
+        self.vocabulary = np.asarray(vocabulary, dtype=object)
+        self.postings = pairs % max(self.rows, 1)
+        self.offsets = np.searchsorted(pairs // max(self.rows, 1), np.arange(len(self.vocabulary) + 1))
+
+        self.sort_columns = [column for column in sort_columns if column in df.columns]
+        self._orders = {}
+        self.build_seconds = time.perf_counter() - start
+
+    # Posições das linhas na ordem de uma coluna (nulos sempre no fim), calculada na primeira vez
+    def _order(self, column, ascending):
+        if (column, ascending) not in self._orders:
+            values = self.df[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                values = values.astype(object)
+            if column == 'Chave':
+                self._orders[(column, ascending)] = _key_order(values, ascending)
+            else:
+                ranks = values.rank(method='first', ascending=ascending, na_option='bottom').to_numpy()
+                self._orders[(column, ascending)] = np.argsort(ranks, kind='stable')
+        return self._orders[(column, ascending)]
+
+    # Máscara das linhas com a palavra (ou com alguma palavra que começa com ela, se prefix=True).
+    # Palavras vizinhas no vocabulário ordenado têm as listas de linhas vizinhas em postings.
+    def _token_mask(self, token, prefix):
+        first = np.searchsorted(self.vocabulary, token, side='left')
+        if prefix:
+            last = np.searchsorted(self.vocabulary, token + '~', side='left')
+        else:
+            last = first + 1 if first < len(self.vocabulary) and self.vocabulary[first] == token else first
+        mask = np.zeros(self.rows, dtype=bool)
+        mask[self.postings[self.offsets[first]:self.offsets[last]]] = True
+        return mask
+
+    # Máscara booleana das linhas que contêm todas as palavras da consulta (None = sem busca)
+    def search(self, query):
+        tokens = tokenize(query or '')
+        if not tokens:
+            return None
+        mask = self._token_mask(tokens[-1], prefix=True)
+        for token in tokens[:-1]:
+            mask &= self._token_mask(token, prefix=False)
+        return mask
+
+    # Uma página de resultados: filtra (busca + igualdades), ordena pela ordem pré-calculada e só então
+    # projeta as colunas da página. Retorna (página, total de linhas encontradas).
+    def page(self, query=None, equals=None, sort_by=None, ascending=True, page=0, page_size=50, columns=None):
+        mask = self.search(query)
+        if mask is None:
+            mask = np.ones(self.rows, dtype=bool)
+        for column, value in (equals or {}).items():
+            mask &= (self.df[column] == value).to_numpy(dtype=bool, na_value=False)
+
+        order = self._order(sort_by, ascending) if sort_by in self.sort_columns else np.arange(self.rows)
+        selected = order[mask[order]]
+        start = page * page_size
+        rows = selected[start:start + page_size]
+        columns = [column for column in (columns or self.df.columns) if column in self.df.columns]
+        return self.df.take(rows)[columns], len(selected)
@@ -0,0 +1,113 @@
+import hashlib
+import os
+
+import pyarrow.feather as feather
+from filelock import FileLock
+
+# Diretório do cache colunar (pode ser trocado pela variável de ambiente)
+CACHE_DIR = os.environ.get('DASHBOARD_CACHE_DIR', '.cache')
+
+# Tamanho máximo do diretório de cache; os arquivos menos usados são removidos primeiro
+CACHE_MAX_BYTES = int(os.environ.get('DASHBOARD_CACHE_MAX_BYTES', 512 * 2 ** 20))
+
+CACHE_SUFFIX = '.arrow'
+
+# Hash por arquivo, reaproveitado enquanto tamanho e data de modificação não mudarem
+_file_hashes = {}
+
+
+# Calcula o SHA-256 do conteúdo de um arquivo, lendo em blocos
+def file_hash(file_path):
+    stat = os.stat(file_path)
+    marker = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+    if marker in _file_hashes:
+        return _file_hashes[marker]
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(block)
+    _file_hashes[marker] = digest.hexdigest()
+    return _file_hashes[marker]
+
+
+# Chave do cache: nome lógico + versão do processamento + conteúdo de cada arquivo de origem
+def cache_key(name, sources, version):
+    digest = hashlib.sha256(f'{name}:{version}'.encode('utf-8'))
+    for source in sources:
+        digest.update(file_hash(source).encode('ascii'))
+    return f'{name}-{digest.hexdigest()[:32]}'
+
+
+def _cache_path(key, cache_dir):
+    return os.path.join(cache_dir, key + CACHE_SUFFIX)
+
+
+# Lê um DataFrame do cache via memory-map; retorna None se não existir
+def read_cached(key, cache_dir=CACHE_DIR):
+    path = _cache_path(key, cache_dir)
+    if not os.path.exists(path):
+        return None
+    table = feather.read_table(path, memory_map=True)
+    os.utime(path)  # marca o uso recente para a política de remoção
+    return table.to_pandas()
+
+
+# Grava um DataFrame no cache (Arrow IPC sem compressão, para permitir memory-map)
+def write_cached(key, df, cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+    os.makedirs(cache_dir, exist_ok=True)
+    path = _cache_path(key, cache_dir)
+    tmp_path = path + '.tmp'
+    feather.write_feather(df.reset_index(drop=True), tmp_path, compression='uncompressed')
+    os.replace(tmp_path, path)
+    evict(cache_dir, max_bytes, keep=path)
+
+
+# Remove os arquivos menos usados até o diretório caber em max_bytes
+def evict(cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES, keep=None):
+    if not os.path.isdir(cache_dir):
+        return []
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(CACHE_SUFFIX):
+            path = os.path.join(cache_dir, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    removed = []
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        os.remove(path)
+        total -= size
+        removed.append(path)
+    return removed
+
+
+# Invalida as entradas de um nome lógico (ou todas, se name for None)
+def clear_cache(name=None, cache_dir=CACHE_DIR):
+    if not os.path.isdir(cache_dir):
+        return []
+    removed = []
+    for entry in os.listdir(cache_dir):
+        if entry.endswith(CACHE_SUFFIX) and (name is None or entry.startswith(name + '-')):
+            os.remove(os.path.join(cache_dir, entry))
+            removed.append(entry)
+    return removed
+
+
+# Retorna o DataFrame do cache ou o constrói com build() e grava para as próximas execuções
+def cached_frame(name, sources, version, build, cache_dir=CACHE_DIR):
+    key = cache_key(name, sources, version)
+    df = read_cached(key, cache_dir)
+    if df is not None:
+        return df
+    os.makedirs(cache_dir, exist_ok=True)
+    with FileLock(os.path.join(cache_dir, key + '.lock')):
+        df = read_cached(key, cache_dir)
+        if df is None:
+            df = build()
+            write_cached(key, df, cache_dir)
+    return df
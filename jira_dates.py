@@ -0,0 +1,115 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# Formato das datas na exportação HTML do Jira em português (ex.: '22/mai/24 10:26 AM')
+JIRA_DATE_FORMAT = '%d/%b/%y %I:%M %p'
+
+# Colunas de data da exportação do Jira convertidas na carga
+DATE_COLUMNS = ['Criado', 'Atualizado(a)', 'Resolvido', '[CHART] Date of First Response']
+
+MONTH_MAP = {
+    'jan': 'Jan', 'fev': 'Feb', 'mar': 'Mar', 'abr': 'Apr', 'mai': 'May', 'jun': 'Jun',
+    'jul': 'Jul', 'ago': 'Aug', 'set': 'Sep', 'out': 'Oct', 'nov': 'Nov', 'dez': 'Dec'
+}
+
+_MONTH_PATTERN = re.compile('|'.join(MONTH_MAP))
+
+
+# Função para converter datas (versão escalar, aplicada linha a linha)
+def replace_month(date_str):
+    for pt, en in MONTH_MAP.items():
+        date_str = date_str.replace(pt, en)
+    return date_str
+
+
+# Troca as abreviações de mês em português pelas em inglês em uma Series inteira
+def translate_months(values):
+    return pd.Series(values, dtype=object).str.replace(_MONTH_PATTERN, lambda m: MONTH_MAP[m.group(0)], regex=True)
+
+
+# Converte textos distintos: data e hora são separadas e cada parte distinta é convertida
+# uma vez (há poucos dias e minutos distintos mesmo em milhões de linhas)
+def _parse_unique_texts(texts, date_format):
+    date_part_format, _, time_part_format = date_format.partition(' ')
+    parts = pd.Series(texts, dtype=object).str.split(' ', n=1, expand=True).reindex(columns=[0, 1])
+
+    day_codes, days = pd.factorize(parts[0])
+    parsed_days = pd.to_datetime(translate_months(days), format=date_part_format, errors='coerce').to_numpy()
+
+    time_codes, times = pd.factorize(parts[1])
+    parsed_times = pd.to_datetime(pd.Series(times, dtype=object), format=time_part_format, errors='coerce')
+    parsed_times = (parsed_times - parsed_times.dt.normalize()).to_numpy()
+
+    result = np.full(len(texts), np.datetime64('NaT'), dtype=parsed_days.dtype)
+    valid = (day_codes >= 0) & (time_codes >= 0)
+    result[valid] = parsed_days[day_codes[valid]] + parsed_times[time_codes[valid]]
+    return result
+
+
+# Converte uma coluna de datas do Jira para datetime, processando cada texto distinto uma única vez
+def parse_jira_dates(series, date_format=JIRA_DATE_FORMAT):
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    if ' ' in date_format:
+        parsed = _parse_unique_texts(uniques, date_format)
+    else:
+        parsed = pd.to_datetime(translate_months(uniques), format=date_format, errors='coerce').to_numpy()
+    values = np.full(len(codes), np.datetime64('NaT'), dtype='datetime64[ns]')
+    valid = codes >= 0
+    values[valid] = parsed[codes[valid]]
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+# Converte as colunas de data presentes no DataFrame (uma vez cada, na carga)
+def convert_date_columns(df, columns=DATE_COLUMNS):
+    for column in columns:
+        if column in df.columns:
+            df[column] = parse_jira_dates(df[column])
+    return df
+
+
+# Gera textos de data no formato do Jira para o benchmark
+def _sample_dates(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp('2022-01-01').value // 10 ** 9
+    seconds = rng.integers(0, 3 * 365 * 24 * 3600, rows) // 60 * 60 + start
+    dates = pd.to_datetime(seconds, unit='s')
+    meses = dict(zip(MONTH_MAP.values(), MONTH_MAP.keys()))
+    texto = dates.strftime('%d/%b/%y %I:%M %p').str.replace(r'[A-Z][a-z]{2}', lambda m: meses[m.group(0)], regex=True)
+    texto = pd.Series(texto)
+    texto[rng.random(rows) < 0.3] = ''  # itens sem data (ex.: não resolvidos)
+    return texto
+
+
+# Compara a conversão linha a linha (replace_month + apply) com a vetorizada
+def benchmark(rows=200_000):
+    import time
+
+    texto = _sample_dates(rows)
+
+    start = time.perf_counter()
+    legado = pd.to_datetime(texto.apply(replace_month), format=JIRA_DATE_FORMAT, errors='coerce')
+    tempo_legado = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vetorizado = parse_jira_dates(texto)
+    tempo_vetorizado = time.perf_counter() - start
+
+    return {
+        'linhas': rows,
+        'valores_distintos': texto.nunique(),
+        'resultado_identico': legado.equals(vetorizado),
+        'linha_a_linha_segundos': round(tempo_legado, 3),
+        'vetorizado_segundos': round(tempo_vetorizado, 3),
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    for chave, valor in benchmark(linhas).items():
+        print(f'{chave}: {valor}')
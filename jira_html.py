@@ -0,0 +1,217 @@
+import time
+import tracemalloc
+from html.parser import HTMLParser
+
+import pandas as pd
+
+# Versão do parser; entra na chave de cache dos dados processados
+PARSER_VERSION = '2'
+
+# Tamanho do bloco lido do arquivo a cada passo (em caracteres)
+READ_CHUNK_SIZE = 64 * 1024
+
+# Quantidade de linhas acumuladas antes de virar um DataFrame parcial
+DATAFRAME_CHUNK_ROWS = 5000
+
+
+# Parser incremental da tabela 'issuetable' exportada pelo Jira.
+# Recebe o HTML em pedaços (feed) e guarda apenas a linha em construção,
+# entregando cada <tr> completo assim que ele é fechado.
+# Com columns, só o texto das colunas pedidas é guardado (projeção durante a leitura).
+class IssueTableParser(HTMLParser):
+    def __init__(self, columns=None):
+        super().__init__(convert_charrefs=True)
+        self.columns = columns
+        self.all_headers = []
+        self.headers = []
+        self._keep = None
+        self._cell_index = 0
+        self.rows = []
+        self._table_depth = 0
+        self._issuetable_depth = None
+        self._in_tbody = False
+        self._row = None
+        self._cell = None
+        self._cell_tag = None
+        self.finished = False
+
+    def _in_issuetable(self):
+        return self._issuetable_depth is not None
+
+    def _close_cell(self):
+        if self._cell is None:
+            return
+        text = ''.join(self._cell).strip()
+        if self._cell_tag == 'th':
+            self.all_headers.append(text)
+            if self.columns is None or text in self.columns:
+                self.headers.append(text)
+        elif self._row is not None:
+            self._row.append(text)
+        self._cell = None
+        self._cell_tag = None
+
+    # Índices das colunas mantidas, definidos quando os cabeçalhos terminam
+    def _start_body(self):
+        if self.columns is not None and self._keep is None:
+            self._keep = {index for index, header in enumerate(self.all_headers) if header in self.columns}
+
+    def _close_row(self):
+        self._close_cell()
+        if self._row is not None:
+            self.rows.append(self._row)
+            self._row = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'table':
+            self._table_depth += 1
+            if self._issuetable_depth is None and not self.finished and dict(attrs).get('id') == 'issuetable':
+                self._issuetable_depth = self._table_depth
+            return
+        if not self._in_issuetable() or self._table_depth != self._issuetable_depth:
+            return
+        if tag == 'tbody':
+            self._in_tbody = True
+            self._start_body()
+        elif tag == 'tr':
+            self._close_row()
+            if self._in_tbody:
+                self._row = []
+                self._cell_index = 0
+        elif tag == 'th':
+            self._close_cell()
+            self._cell = []
+            self._cell_tag = tag
+        elif tag == 'td':
+            self._close_cell()
+            if self._row is not None:
+                if self._keep is None or self._cell_index in self._keep:
+                    self._cell = []
+                    self._cell_tag = tag
+                self._cell_index += 1
+
+    def handle_endtag(self, tag):
+        if tag == 'table':
+            if self._in_issuetable() and self._table_depth == self._issuetable_depth:
+                self._close_row()
+                self._issuetable_depth = None
+                self._in_tbody = False
+                self.finished = True
+            self._table_depth = max(self._table_depth - 1, 0)
+            return
+        if not self._in_issuetable() or self._table_depth != self._issuetable_depth:
+            return
+        if tag in ('td', 'th'):
+            self._close_cell()
+        elif tag == 'tr':
+            self._close_row()
+        elif tag == 'tbody':
+            self._close_row()
+            self._in_tbody = False
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def pop_rows(self):
+        rows = self.rows
+        self.rows = []
+        return rows
+
+
+# Alimenta o parser com o arquivo em blocos, entregando as linhas já completas a cada bloco
+def _parse_blocks(file_path, read_chunk_size=READ_CHUNK_SIZE, columns=None):
+    parser = IssueTableParser(columns)
+    with open(file_path, 'r', encoding='utf-8') as file:
+        while not parser.finished:
+            chunk = file.read(read_chunk_size)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            yield parser, parser.pop_rows()
+    parser.close()
+    yield parser, parser.pop_rows()
+    if not parser.all_headers:
+        raise ValueError(f"Tabela 'issuetable' não encontrada em {file_path}")
+
+
+# Gera (cabeçalhos, linha) para cada linha da 'issuetable', lendo o arquivo em blocos
+def iter_issuetable_rows(file_path, read_chunk_size=READ_CHUNK_SIZE, columns=None):
+    for parser, rows in _parse_blocks(file_path, read_chunk_size, columns):
+        for row in rows:
+            yield parser.headers, row
+
+
+# Gera DataFrames parciais com até chunk_rows linhas cada
+def iter_issuetable_chunks(file_path, chunk_rows=DATAFRAME_CHUNK_ROWS, columns=None):
+    headers = []
+    buffer = []
+    emitted = False
+    for parser, rows in _parse_blocks(file_path, columns=columns):
+        headers = parser.headers
+        for row in rows:
+            buffer.append(row)
+            if len(buffer) >= chunk_rows:
+                yield pd.DataFrame(buffer, columns=headers)
+                buffer = []
+                emitted = True
+    if buffer or not emitted:
+        yield pd.DataFrame(buffer, columns=headers)
+
+
+# Carrega a 'issuetable' inteira como DataFrame de strings, montado em blocos.
+# columns limita a leitura às colunas pedidas (None = todas).
+def read_issuetable(file_path, chunk_rows=DATAFRAME_CHUNK_ROWS, columns=None):
+    chunks = list(iter_issuetable_chunks(file_path, chunk_rows, columns))
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks, ignore_index=True)
+
+
+# Implementação antiga com BeautifulSoup, mantida apenas para comparação
+def read_issuetable_bs4(file_path):
+    from bs4 import BeautifulSoup
+
+    with open(file_path, 'r', encoding='utf-8') as file:
+        html_content = file.read()
+
+    soup = BeautifulSoup(html_content, 'html.parser')
+    table = soup.find('table', {'id': 'issuetable'})
+    headers = [header.text.strip() for header in table.find_all('th')]
+    rows = [[cell.text.strip() for cell in row.find_all('td')] for row in table.find('tbody').find_all('tr')]
+    return pd.DataFrame(rows, columns=headers)
+
+
+# Mede tempo e pico de memória de uma função de leitura
+def _measure(read_function, file_path):
+    tracemalloc.start()
+    start = time.perf_counter()
+    df = read_function(file_path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return df, elapsed, peak
+
+
+# Compara o parser incremental com o caminho BeautifulSoup no mesmo arquivo
+def compare_with_bs4(file_path):
+    df_stream, tempo_stream, pico_stream = _measure(read_issuetable, file_path)
+    df_bs4, tempo_bs4, pico_bs4 = _measure(read_issuetable_bs4, file_path)
+    return {
+        'arquivo': file_path,
+        'linhas': len(df_stream),
+        'colunas': len(df_stream.columns),
+        'resultado_identico': df_stream.equals(df_bs4),
+        'streaming_segundos': round(tempo_stream, 3),
+        'streaming_pico_mb': round(pico_stream / 2 ** 20, 1),
+        'bs4_segundos': round(tempo_bs4, 3),
+        'bs4_pico_mb': round(pico_bs4 / 2 ** 20, 1),
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    arquivo = sys.argv[1] if len(sys.argv) > 1 else 'Jira (3).html'
+    for chave, valor in compare_with_bs4(arquivo).items():
+        print(f'{chave}: {valor}')
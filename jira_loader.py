@@ -0,0 +1,116 @@
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from backlog_join import DUPLICATE_RULE, join_backlog
+from backlog_loader import BACKLOG_VERSION, load_backlog_data
+from jira_cache import cached_frame
+from jira_dates import convert_date_columns
+from jira_html import PARSER_VERSION, read_issuetable
+from jira_schema import ISSUE_COLUMNS, apply_schema
+from sla_metrics import add_duration_columns
+
+# Versão do processamento (tipos, colunas derivadas, merge); entra na chave de cache
+LOADER_VERSION = '5'
+
+KEY_COLUMN = 'Chave'
+UPDATED_COLUMN = 'Atualizado(a)'
+
+# Extensões aceitas ao ler um diretório ou padrão glob de exportações
+EXPORT_EXTENSIONS = ('.html', '.htm', '.csv')
+
+# Processos usados para ler várias exportações ao mesmo tempo (0 = um por CPU)
+INGEST_WORKERS = int(os.environ.get('DASHBOARD_INGEST_WORKERS', 0))
+
+
+# Lê uma exportação CSV do Jira (como a gerada por html_csv.py), mantendo tudo como texto.
+# columns limita a leitura às colunas pedidas (None = todas).
+def read_export_csv(file_path, columns=None):
+    with open(file_path, 'r', encoding='utf-8-sig') as file:
+        header = file.readline()
+    sep = ';' if header.count(';') > header.count(',') else ','
+    usecols = (lambda column: column in columns) if columns is not None else None
+    return pd.read_csv(file_path, sep=sep, dtype=str, keep_default_na=False, encoding='utf-8-sig', usecols=usecols)
+
+
+# Tipos e colunas derivadas comuns às exportações HTML e CSV
+def process_issues(df):
+    df = convert_date_columns(df)
+
+    # Filtrando registros inválidos
+    # df = df[df['Criado'].notnull() & df['Resolvido'].notnull() & (df['Resolvido'] >= df['Criado'])]
+
+    # Dias corridos e horas úteis até a primeira resposta e até a solução (NaN quando falta a data)
+    return add_duration_columns(df)
+
+
+# Carregar e processar o arquivo HTML (só as colunas do esquema)
+def load_html_data(file_path):
+    return apply_schema(process_issues(read_issuetable(file_path, columns=ISSUE_COLUMNS)))
+
+
+# Carregar e processar uma exportação do Jira em HTML ou CSV
+def load_export_data(file_path):
+    if file_path.lower().endswith('.csv'):
+        return apply_schema(process_issues(read_export_csv(file_path, columns=ISSUE_COLUMNS)))
+    return load_html_data(file_path)
+
+
+# Lista as exportações de um ou mais arquivos, diretórios ou padrões glob ('exports/Jira*.html').
+# O Jira limita a quantidade de itens por exportação, então um projeto costuma vir em vários arquivos.
+def export_paths(sources):
+    paths = []
+    for source in [sources] if isinstance(sources, str) else sources:
+        if os.path.isdir(source):
+            found = [os.path.join(source, name) for name in os.listdir(source)]
+        elif os.path.exists(source):
+            paths.append(source)
+            continue
+        else:
+            found = glob.glob(source)
+        paths += sorted(path for path in found if os.path.isfile(path) and path.lower().endswith(EXPORT_EXTENSIONS))
+    return list(dict.fromkeys(paths))
+
+
+# Mantém uma linha por 'Chave': a de 'Atualizado(a)' mais recente (em empate, a do último arquivo)
+def deduplicate_issues(issues):
+    newest = issues.sort_values(UPDATED_COLUMN, kind='stable', na_position='first')
+    return newest.drop_duplicates(subset=KEY_COLUMN, keep='last').sort_index().reset_index(drop=True)
+
+
+# Lê várias exportações em paralelo, uma por processo. Cada processo faz o parse e o processamento
+# do seu arquivo e devolve só o DataFrame já reduzido ao esquema (o parser não monta árvore do HTML).
+def load_exports(sources, workers=INGEST_WORKERS):
+    paths = export_paths(sources)
+    if not paths:
+        raise FileNotFoundError(f'Nenhuma exportação HTML/CSV encontrada em {sources}')
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            frames = list(executor.map(load_export_data, paths))
+    else:
+        frames = [load_export_data(path) for path in paths]
+    # Categorias diferentes entre arquivos viram texto no concat; o esquema as restaura
+    issues = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    return apply_schema(deduplicate_issues(issues))
+
+
+# Combinando dados do backlog com dados do Jira: chaves normalizadas e um card por item,
+# escolhido pela regra de duplicidade (ver backlog_join.DUPLICATE_RULES)
+def merge_backlog(jira_data, backlog_data, rule=DUPLICATE_RULE):
+    return join_backlog(jira_data, backlog_data, rule)
+
+
+# Versão usada no cache dos dados combinados com o backlog (a regra e a leitura do backlog mudam o resultado)
+def merge_version():
+    return f'{PARSER_VERSION}-{LOADER_VERSION}-{BACKLOG_VERSION}-{DUPLICATE_RULE}'
+
+
+# Carrega Jira + backlog já processados e combinados, usando o cache colunar em disco
+def load_dashboard_data(html_path, backlog_path):
+    def build():
+        return apply_schema(merge_backlog(load_html_data(html_path), load_backlog_data(backlog_path)))
+
+    return cached_frame('dashboard', [html_path, backlog_path], merge_version(), build)
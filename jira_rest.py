@@ -0,0 +1,267 @@
+import asyncio
+import glob
+import json
+import math
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pyarrow.feather as feather
+import requests
+from requests.adapters import HTTPAdapter
+
+from jira_dates import DATE_COLUMNS
+from jira_loader import deduplicate_issues, process_issues
+from jira_schema import ISSUE_COLUMNS, apply_schema
+
+# Servidor do Jira e credenciais (usuário + token de API = autenticação básica; só o token = Bearer)
+JIRA_URL = os.environ.get('DASHBOARD_JIRA_URL', 'http://127.0.0.1:8765')
+JIRA_USER = os.environ.get('DASHBOARD_JIRA_USER')
+JIRA_TOKEN = os.environ.get('DASHBOARD_JIRA_TOKEN')
+JIRA_JQL = os.environ.get('DASHBOARD_JIRA_JQL', 'ORDER BY created DESC')
+
+SEARCH_PATH = '/rest/api/2/search'
+
+# Itens por página (o Jira Cloud limita a 100) e requisições simultâneas
+PAGE_SIZE = int(os.environ.get('DASHBOARD_JIRA_PAGE_SIZE', 100))
+CONCURRENCY = int(os.environ.get('DASHBOARD_JIRA_CONCURRENCY', 4))
+
+# Novas tentativas para falhas de conexão, 429 e 5xx, com espera exponencial (ou o Retry-After)
+MAX_RETRIES = int(os.environ.get('DASHBOARD_JIRA_RETRIES', 5))
+BACKOFF_SECONDS = float(os.environ.get('DASHBOARD_JIRA_BACKOFF', 0.5))
+RETRY_STATUS = {429, 500, 502, 503, 504}
+TIMEOUT_SECONDS = 30
+
+# Campo personalizado com a data da primeira resposta ('[CHART] Date of First Response');
+# o id varia por instalação (ex.: customfield_10100). Vazio = coluna sem datas.
+FIRST_RESPONSE_FIELD = os.environ.get('DASHBOARD_JIRA_FIRST_RESPONSE_FIELD', '')
+
+# A exportação HTML mostra as datas no fuso do usuário, com resolução de minutos
+JIRA_TIMEZONE = os.environ.get('DASHBOARD_JIRA_TIMEZONE', 'America/Sao_Paulo')
+
+# Páginas já baixadas, para retomar uma ingestão interrompida
+CHECKPOINT_DIR = os.environ.get('DASHBOARD_JIRA_CHECKPOINT_DIR', 'jira_rest')
+STATE_NAME = 'state.json'
+
+FIELDS = ['summary', 'issuetype', 'status', 'priority', 'assignee', 'created', 'updated', 'resolutiondate',
+          'description', 'parent']
+
+
+def _name(value, key='name', default=''):
+    return (value or {}).get(key) or default
+
+
+# Converte um item da API (chave + fields) para as colunas da exportação HTML
+def _issue_row(issue, first_response_field=FIRST_RESPONSE_FIELD):
+    fields = issue.get('fields') or {}
+    parent = (fields.get('parent') or {}).get('fields')
+    return {
+        'Chave': issue['key'],
+        'Resumo': fields.get('summary') or '',
+        'Tipo de item': _name(fields.get('issuetype')),
+        'Status': _name(fields.get('status')),
+        'Prioridade': _name(fields.get('priority')),
+        'Responsável': _name(fields.get('assignee'), 'displayName', 'Não atribuído'),
+        'Criado': fields.get('created'),
+        'Atualizado(a)': fields.get('updated'),
+        'Resolvido': fields.get('resolutiondate'),
+        'Descrição': fields.get('description') or '',
+        'Pai': _name(parent, 'summary'),
+        '[CHART] Date of First Response': fields.get(first_response_field) if first_response_field else None,
+    }
+
+
+# Datas ISO da API ('2024-05-22T10:26:31.000-0300') no horário local, truncadas no minuto como na exportação
+def _local_dates(values, timezone=JIRA_TIMEZONE):
+    dates = pd.to_datetime(values, utc=True, errors='coerce', format='ISO8601')
+    return dates.dt.tz_convert(timezone).dt.tz_localize(None).dt.floor('min')
+
+
+# Itens de uma página da API como DataFrame com as colunas de load_html_data (antes das derivadas)
+def issues_frame(issues, first_response_field=FIRST_RESPONSE_FIELD, timezone=JIRA_TIMEZONE):
+    df = pd.DataFrame([_issue_row(issue, first_response_field) for issue in issues], columns=ISSUE_COLUMNS)
+    for column in DATE_COLUMNS:
+        df[column] = _local_dates(df[column], timezone)
+    return df
+
+
+# Cliente da busca do Jira: uma sessão HTTP com pool de conexões (keep-alive) compartilhada pelas
+# requisições; as chamadas bloqueantes rodam em threads e um semáforo limita as simultâneas.
+class JiraClient:
+    def __init__(self, base_url=JIRA_URL, user=JIRA_USER, token=JIRA_TOKEN, concurrency=CONCURRENCY,
+                 retries=MAX_RETRIES, backoff=BACKOFF_SECONDS, timeout=TIMEOUT_SECONDS):
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.requests = 0
+        self.retried = 0
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['Accept'] = 'application/json'
+        if user and token:
+            self.session.auth = (user, token)
+        elif token:
+            self.session.headers['Authorization'] = f'Bearer {token}'
+        self._semaphore = None
+
+    def _get(self, params):
+        self.requests += 1
+        return self.session.get(self.base_url + SEARCH_PATH, params=params, timeout=self.timeout)
+
+    # Espera antes da próxima tentativa: Retry-After do servidor ou exponencial com variação aleatória
+    def _delay(self, attempt, retry_after=None):
+        try:
+            return float(retry_after)
+        except (TypeError, ValueError):
+            return self.backoff * 2 ** attempt * (1 + random.random())
+
+    # Uma página da busca (JSON da API), com novas tentativas fora do semáforo
+    async def search_page(self, jql, start_at, page_size=PAGE_SIZE, fields=FIELDS):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        params = {'jql': jql, 'startAt': start_at, 'maxResults': page_size, 'fields': ','.join(fields)}
+        for attempt in range(self.retries + 1):
+            retry_after = None
+            async with self._semaphore:
+                try:
+                    response = await asyncio.to_thread(self._get, params)
+                except (requests.ConnectionError, requests.Timeout) as error:
+                    failure = error
+                else:
+                    if response.status_code == 200:
+                        return response.json()
+                    if response.status_code not in RETRY_STATUS:
+                        response.raise_for_status()
+                    failure = requests.HTTPError(f'{response.status_code} em startAt={start_at}', response=response)
+                    retry_after = response.headers.get('Retry-After')
+            if attempt == self.retries:
+                raise failure
+            self.retried += 1
+            await asyncio.sleep(self._delay(attempt, retry_after))
+
+    def close(self):
+        self.session.close()
+
+
+def _page_path(checkpoint_dir, page):
+    return os.path.join(checkpoint_dir, f'page-{page:06d}.arrow')
+
+
+def _read_state(checkpoint_dir):
+    path = os.path.join(checkpoint_dir, STATE_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def _write_state(checkpoint_dir, state):
+    path = os.path.join(checkpoint_dir, STATE_NAME)
+    with open(path + '.tmp', 'w', encoding='utf-8') as file:
+        json.dump(state, file, ensure_ascii=False, indent=2)
+    os.replace(path + '.tmp', path)
+
+
+# Apaga só os arquivos gravados por este módulo (state.json e page-*.arrow, com os temporários);
+# o diretório só é removido se ficar vazio, então um --checkpoint-dir com outros arquivos é preservado
+def clear_checkpoint(checkpoint_dir):
+    patterns = [STATE_NAME, STATE_NAME + '.tmp', 'page-[0-9]*.arrow', 'page-[0-9]*.arrow.tmp']
+    for pattern in patterns:
+        for path in glob.glob(os.path.join(glob.escape(checkpoint_dir), pattern)):
+            os.remove(path)
+    try:
+        os.rmdir(checkpoint_dir)
+    except OSError:
+        pass
+
+
+def _save_page(checkpoint_dir, page, df):
+    path = _page_path(checkpoint_dir, page)
+    feather.write_feather(df, path + '.tmp', compression='uncompressed')
+    os.replace(path + '.tmp', path)
+
+
+# Baixa todas as páginas de uma busca. A primeira página informa o total; as demais são pedidas
+# ao mesmo tempo (limitadas pelo semáforo do cliente). Cada página é gravada no checkpoint assim
+# que chega: se a ingestão for interrompida, a próxima execução com a mesma JQL só pede as que faltam.
+async def fetch_pages(client, jql=JIRA_JQL, page_size=PAGE_SIZE, checkpoint_dir=CHECKPOINT_DIR,
+                      first_response_field=FIRST_RESPONSE_FIELD):
+    fields = FIELDS + ([first_response_field] if first_response_field else [])
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    state = _read_state(checkpoint_dir)
+    if state.get('jql') != jql or state.get('page_size') != page_size or state.get('fields') != fields:
+        clear_checkpoint(checkpoint_dir)
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        state = {'jql': jql, 'page_size': page_size, 'fields': fields, 'total': None}
+
+    if state['total'] is None or not os.path.exists(_page_path(checkpoint_dir, 0)):
+        result = await client.search_page(jql, 0, page_size, fields)
+        _save_page(checkpoint_dir, 0, issues_frame(result.get('issues', []), first_response_field))
+        state['total'] = result.get('total', 0)
+        _write_state(checkpoint_dir, state)
+
+    pages = range(max(math.ceil(state['total'] / page_size), 1))
+    missing = [page for page in pages if not os.path.exists(_page_path(checkpoint_dir, page))]
+
+    async def fetch(page):
+        result = await client.search_page(jql, page * page_size, page_size, fields)
+        _save_page(checkpoint_dir, page, issues_frame(result.get('issues', []), first_response_field))
+
+    # Todas as páginas terminam (ou falham) antes do erro subir, para o checkpoint ficar completo
+    errors = [error for error in await asyncio.gather(*(fetch(page) for page in missing), return_exceptions=True)
+              if isinstance(error, BaseException)]
+    if errors:
+        raise errors[0]
+    return [_page_path(checkpoint_dir, page) for page in pages], len(missing)
+
+
+async def _load(client, jql, page_size, checkpoint_dir, first_response_field):
+    # Threads suficientes para as requisições simultâneas do cliente
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=client.concurrency))
+    try:
+        paths, _ = await fetch_pages(client, jql, page_size, checkpoint_dir, first_response_field)
+    finally:
+        client.close()
+    issues = pd.concat([feather.read_feather(path) for path in paths], ignore_index=True)
+    return apply_schema(process_issues(deduplicate_issues(issues)))
+
+
+# Carrega os itens da busca do Jira com as mesmas colunas e tipos de load_html_data.
+# A paginação por startAt pode repetir ou pular itens se a busca mudar durante a carga;
+# os repetidos são resolvidos pela 'Chave' (o mais recente). O checkpoint é apagado ao final.
+def load_rest_data(jql=JIRA_JQL, client=None, page_size=PAGE_SIZE, checkpoint_dir=CHECKPOINT_DIR,
+                   first_response_field=FIRST_RESPONSE_FIELD):
+    df = asyncio.run(_load(client or JiraClient(), jql, page_size, checkpoint_dir, first_response_field))
+    clear_checkpoint(checkpoint_dir)
+    return df
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from jira_store import STORE_DIR, ingest_issues
+
+    parser = argparse.ArgumentParser(description='Importa itens da API REST do Jira para o armazenamento incremental')
+    parser.add_argument('--url', default=JIRA_URL)
+    parser.add_argument('--jql', default=JIRA_JQL)
+    parser.add_argument('--page-size', type=int, default=PAGE_SIZE)
+    parser.add_argument('--concurrency', type=int, default=CONCURRENCY)
+    parser.add_argument('--retries', type=int, default=MAX_RETRIES)
+    parser.add_argument('--first-response-field', default=FIRST_RESPONSE_FIELD)
+    parser.add_argument('--checkpoint-dir', default=CHECKPOINT_DIR)
+    parser.add_argument('--store', default=STORE_DIR)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    cliente = JiraClient(args.url, concurrency=args.concurrency, retries=args.retries)
+    itens = load_rest_data(args.jql, cliente, args.page_size, args.checkpoint_dir, args.first_response_field)
+    resultado = ingest_issues(itens, args.store)
+    resultado.update({'requisicoes': cliente.requests, 'novas_tentativas': cliente.retried,
+                      'segundos': round(time.perf_counter() - start, 3)})
+    print(resultado)
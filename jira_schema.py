@@ -0,0 +1,83 @@
+import pandas as pd
+
+from sla_metrics import DURATION_COLUMNS as DURATION_MEASURES
+
+# Colunas da exportação do Jira usadas pelo dashboard (as demais ~70 são descartadas na leitura)
+ISSUE_COLUMNS = [
+    'Chave', 'Resumo', 'Tipo de item', 'Status', 'Prioridade', 'Responsável', 'Criado',
+    'Atualizado(a)', 'Resolvido', 'Descrição', 'Pai', '[CHART] Date of First Response',
+]
+
+# Colunas do backlog usadas no merge, nos gráficos e na tabela
+BACKLOG_COLUMNS = [
+    '#JIRA\nCard', 'Data Pré', 'Data Produção', 'Versão', 'Análise x Documentação/Desenvolvimento/QA/Entrega',
+]
+
+# Colunas de data do backlog: as células digitadas como texto (ex.: '22/03/2024', 'Final de Agosto')
+# guardam o texto original em '<coluna> (texto)', ao lado da coluna de datas
+BACKLOG_DATE_COLUMNS = ['Data Pré', 'Data Produção']
+DATE_TEXT_SUFFIX = ' (texto)'
+BACKLOG_TEXT_COLUMNS = [column + DATE_TEXT_SUFFIX for column in BACKLOG_DATE_COLUMNS]
+
+# Colunas de baixa cardinalidade guardadas como categorias
+CATEGORICAL_COLUMNS = ['Tipo de item', 'Status', 'Prioridade', 'Responsável', 'Pai', 'Versão']
+
+# Durações (dias corridos e horas úteis) em float32: NaN quando falta a data de resposta/solução
+DURATION_COLUMNS = {column: 'float32' for column in DURATION_MEASURES}
+
+# Colunas derivadas calculadas na carga
+DERIVED_COLUMNS = list(DURATION_COLUMNS)
+
+# Todas as colunas mantidas no DataFrame combinado
+DASHBOARD_COLUMNS = ISSUE_COLUMNS + DERIVED_COLUMNS + BACKLOG_COLUMNS + BACKLOG_TEXT_COLUMNS
+
+
+# Aplica o esquema: mantém só as colunas declaradas e converte categorias e contagens
+def apply_schema(df, columns=DASHBOARD_COLUMNS):
+    df = df[[column for column in df.columns if column in columns]]
+    for column in df.columns:
+        if column in CATEGORICAL_COLUMNS and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype('category')
+        elif column in DURATION_COLUMNS and df[column].dtype != DURATION_COLUMNS[column]:
+            df[column] = df[column].astype(DURATION_COLUMNS[column])
+    return df
+
+
+# Memória ocupada por coluna (em bytes, contando o conteúdo das strings)
+def memory_by_column(df):
+    return df.memory_usage(deep=True, index=False)
+
+
+# Relatório de memória por coluna antes/depois do esquema (colunas descartadas ficam com 0)
+def memory_report(before, after):
+    report = pd.DataFrame({
+        'antes_kb': memory_by_column(before) / 1024,
+        'depois_kb': memory_by_column(after) / 1024,
+        'dtype_antes': before.dtypes.astype(str),
+        'dtype_depois': after.dtypes.astype(str),
+    })
+    report[['antes_kb', 'depois_kb']] = report[['antes_kb', 'depois_kb']].fillna(0)
+    report[['dtype_antes', 'dtype_depois']] = report[['dtype_antes', 'dtype_depois']].fillna('-')
+    report = report.sort_values('antes_kb', ascending=False)
+    report.loc['TOTAL'] = [report['antes_kb'].sum(), report['depois_kb'].sum(), '', '']
+    report[['antes_kb', 'depois_kb']] = report[['antes_kb', 'depois_kb']].astype(float).round(1)
+    return report
+
+
+if __name__ == "__main__":
+    import sys
+
+    from backlog_loader import load_backlog_data
+    from jira_html import read_issuetable
+    from jira_loader import load_html_data, merge_backlog, process_issues
+
+    arquivo = sys.argv[1] if len(sys.argv) > 1 else 'Jira (3).html'
+    backlog = sys.argv[2] if len(sys.argv) > 2 else 'backlog.xlsx'
+
+    # Antes: todas as colunas como texto (sem projeção nem categorias)
+    antes = merge_backlog(process_issues(read_issuetable(arquivo)), load_backlog_data(backlog, columns=None))
+    depois = merge_backlog(load_html_data(arquivo), load_backlog_data(backlog))
+    pd.set_option('display.max_rows', None)
+    pd.set_option('display.max_columns', None)
+    pd.set_option('display.width', 200)
+    print(memory_report(antes, depois).to_string())
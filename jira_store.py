@@ -0,0 +1,177 @@
+import json
+import os
+
+import pandas as pd
+import pyarrow.feather as feather
+from filelock import FileLock
+
+from backlog_loader import load_backlog_data
+from jira_cache import cache_key, cached_frame
+from jira_loader import (INGEST_WORKERS, KEY_COLUMN, LOADER_VERSION, UPDATED_COLUMN, export_paths, load_exports,
+                         merge_backlog, merge_version)
+from jira_schema import apply_schema
+from metrics_cube import build_cube
+from sla_metrics import add_duration_columns
+
+# Diretório do armazenamento incremental de itens do Jira
+STORE_DIR = os.environ.get('DASHBOARD_STORE_DIR', 'jira_store')
+
+# Exportações lidas quando o armazenamento ainda não existe (arquivo, diretório ou padrão glob)
+EXPORT_SOURCES = os.environ.get('DASHBOARD_EXPORTS', 'Jira (3).html')
+
+# Acima desta quantidade de segmentos, eles são compactados em um só
+MAX_SEGMENTS = 16
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def _manifest_path(store_dir):
+    return os.path.join(store_dir, MANIFEST_NAME)
+
+
+# Lê o manifesto do armazenamento (segmentos e marca d'água de 'Atualizado(a)')
+def read_manifest(store_dir=STORE_DIR):
+    path = _manifest_path(store_dir)
+    if not os.path.exists(path):
+        return {'version': LOADER_VERSION, 'watermark': None, 'next_segment': 1, 'segments': []}
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def _write_manifest(store_dir, manifest):
+    path = _manifest_path(store_dir)
+    with open(path + '.tmp', 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+    os.replace(path + '.tmp', path)
+
+
+# Caminhos dos segmentos, do mais antigo ao mais recente
+def segment_paths(store_dir=STORE_DIR):
+    return [os.path.join(store_dir, name) for name in read_manifest(store_dir)['segments']]
+
+
+def _write_segment(store_dir, manifest, df):
+    name = f"segment-{manifest['next_segment']:06d}.arrow"
+    feather.write_feather(df.reset_index(drop=True), os.path.join(store_dir, name), compression='uncompressed')
+    manifest['next_segment'] += 1
+    manifest['segments'].append(name)
+
+
+# Lê todos os itens do armazenamento, mantendo a versão mais recente de cada 'Chave'
+def read_issues(store_dir=STORE_DIR):
+    paths = segment_paths(store_dir)
+    if not paths:
+        return pd.DataFrame(columns=[KEY_COLUMN, UPDATED_COLUMN])
+    segments = [feather.read_table(path, memory_map=True).to_pandas() for path in paths]
+    issues = pd.concat(segments, ignore_index=True) if len(segments) > 1 else segments[0]
+    issues = issues.drop_duplicates(subset=KEY_COLUMN, keep='last').reset_index(drop=True)
+    # Durações recalculadas a partir das datas: segmentos gravados por versões anteriores também
+    # passam a ter as colunas atuais. Categorias diferentes viram texto no concat; o esquema as restaura.
+    return apply_schema(add_duration_columns(issues))
+
+
+# Junta os segmentos em um só quando passam do limite
+def compact(store_dir=STORE_DIR):
+    os.makedirs(store_dir, exist_ok=True)
+    with FileLock(os.path.join(store_dir, 'store.lock')):
+        manifest = read_manifest(store_dir)
+        if len(manifest['segments']) <= 1:
+            return manifest
+        old_segments = manifest['segments']
+        issues = read_issues(store_dir)
+        manifest['segments'] = []
+        _write_segment(store_dir, manifest, issues)
+        _write_manifest(store_dir, manifest)
+        for name in old_segments:
+            os.remove(os.path.join(store_dir, name))
+        return manifest
+
+
+# 'Atualizado(a)' guardado para cada 'Chave' (a versão mais recente, lida só dessas duas colunas)
+def stored_updates(store_dir=STORE_DIR):
+    paths = segment_paths(store_dir)
+    if not paths:
+        return pd.Series(dtype='datetime64[ns]')
+    columns = [KEY_COLUMN, UPDATED_COLUMN]
+    segments = [feather.read_table(path, columns=columns, memory_map=True).to_pandas() for path in paths]
+    stored = pd.concat(segments, ignore_index=True).drop_duplicates(subset=KEY_COLUMN, keep='last')
+    return stored.set_index(KEY_COLUMN)[UPDATED_COLUMN]
+
+
+# Seleciona, chave a chave, as linhas que mudam o armazenamento: 'Chave' ainda não guardada ou
+# 'Atualizado(a)' mais novo que o guardado para ela (sem data, a linha é reaplicada).
+# Uma exportação parcial ou mais antiga que as anteriores não perde os itens que ainda não existem.
+def _select_delta(issues, stored):
+    updated = issues[UPDATED_COLUMN]
+    previous = issues[KEY_COLUMN].astype(object).map(stored)
+    return issues[previous.isna() | updated.isna() | (updated > previous)]
+
+
+# Insere/atualiza no armazenamento itens já processados (uma linha por 'Chave').
+# Só as linhas novas ou atualizadas são gravadas, em um segmento próprio. A marca d'água
+# (maior 'Atualizado(a)' guardado) é só informativa.
+def ingest_issues(issues, store_dir=STORE_DIR):
+    os.makedirs(store_dir, exist_ok=True)
+    with FileLock(os.path.join(store_dir, 'store.lock')):
+        manifest = read_manifest(store_dir)
+        delta = _select_delta(issues, stored_updates(store_dir))
+        if not delta.empty:
+            _write_segment(store_dir, manifest, delta)
+            newest = delta[UPDATED_COLUMN].max()
+            if pd.notna(newest) and (manifest['watermark'] is None or newest > pd.Timestamp(manifest['watermark'])):
+                manifest['watermark'] = newest.isoformat()
+            _write_manifest(store_dir, manifest)
+        segments = len(manifest['segments'])
+    if segments > MAX_SEGMENTS:
+        compact(store_dir)
+    return {'linhas_lidas': len(issues), 'linhas_gravadas': len(delta), 'marca_dagua': manifest['watermark']}
+
+
+# Insere/atualiza no armazenamento os itens de exportações HTML ou CSV do Jira (arquivos, diretórios
+# ou padrões glob, lidos em paralelo e deduplicados pela 'Chave')
+def ingest(sources, store_dir=STORE_DIR, workers=INGEST_WORKERS):
+    paths = export_paths(sources)
+    return {'arquivos': paths, **ingest_issues(load_exports(paths, workers), store_dir)}
+
+
+# Carrega os itens do armazenamento combinados com o backlog, usando o cache colunar
+def load_store_dashboard_data(backlog_path, store_dir=STORE_DIR):
+    def build():
+        return apply_schema(merge_backlog(read_issues(store_dir), load_backlog_data(backlog_path)))
+
+    return cached_frame('store', segment_paths(store_dir) + [backlog_path], merge_version(), build)
+
+
+# Carrega o cubo de métricas dos itens do armazenamento, usando o cache colunar
+def load_store_cube(backlog_path, store_dir=STORE_DIR):
+    def build():
+        return build_cube(load_store_dashboard_data(backlog_path, store_dir))
+
+    return cached_frame('cube', segment_paths(store_dir) + [backlog_path], merge_version(), build)
+
+
+# Identifica o conteúdo atual do armazenamento + backlog (muda a cada ingestão ou edição da planilha)
+def store_version(backlog_path, store_dir=STORE_DIR):
+    return cache_key('cube', segment_paths(store_dir) + [backlog_path], merge_version())
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Armazenamento incremental de itens do Jira')
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+    ingest_parser = subparsers.add_parser('ingest', help='importa exportações HTML/CSV do Jira')
+    ingest_parser.add_argument('arquivos', nargs='+', help='arquivos, diretórios ou padrões glob (entre aspas)')
+    ingest_parser.add_argument('--workers', type=int, default=INGEST_WORKERS,
+                               help='processos de leitura (0 = um por CPU)')
+    subparsers.add_parser('compact', help='junta os segmentos em um só')
+    subparsers.add_parser('info', help='mostra a marca d\'água e os segmentos')
+    parser.add_argument('--store', default=STORE_DIR)
+    args = parser.parse_args()
+
+    if args.comando == 'ingest':
+        print(ingest(args.arquivos, args.store, args.workers))
+    elif args.comando == 'compact':
+        print(compact(args.store))
+    else:
+        print(json.dumps(read_manifest(args.store), ensure_ascii=False, indent=2))
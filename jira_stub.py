@@ -0,0 +1,151 @@
+import datetime
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from jira_dates import JIRA_DATE_FORMAT, replace_month
+from jira_rest import SEARCH_PATH
+from synthetic_data import iter_issues
+
+# Fuso das datas servidas (o mesmo padrão de jira_rest.JIRA_TIMEZONE, sem horário de verão desde 2019)
+STUB_UTC_OFFSET = '-0300'
+
+# Campo personalizado usado para a data da primeira resposta nas páginas do stub
+STUB_FIRST_RESPONSE_FIELD = 'customfield_10100'
+
+
+# Data da exportação HTML ('22/mai/24 10:26 AM') no formato da API ('2024-05-22T10:26:00.000-0300')
+def _api_date(text):
+    if not text:
+        return None
+    value = datetime.datetime.strptime(replace_month(text), JIRA_DATE_FORMAT)
+    return value.strftime('%Y-%m-%dT%H:%M:%S.000') + STUB_UTC_OFFSET
+
+
+# Itens no formato da busca da API, com os mesmos dados de synthetic_data.write_html_export(seed)
+def fixture_issues(issues, seed=0):
+    result = []
+    for row in iter_issues(issues, seed):
+        responsavel = row['Responsável']
+        result.append({
+            'key': row['Chave'],
+            'fields': {
+                'summary': row['Resumo'],
+                'issuetype': {'name': str(row['Tipo de item'])},
+                'status': {'name': str(row['Status'])},
+                'priority': {'name': str(row['Prioridade'])},
+                'assignee': None if responsavel == 'Não atribuído' else {'displayName': str(responsavel)},
+                'created': _api_date(row['Criado']),
+                'updated': _api_date(row['Atualizado(a)']),
+                'resolutiondate': _api_date(row['Resolvido']),
+                'description': row['Descrição'],
+                'parent': {'fields': {'summary': str(row['Pai'])}} if row['Pai'] else None,
+                STUB_FIRST_RESPONSE_FIELD: _api_date(row['[CHART] Date of First Response']),
+            },
+        })
+    return result
+
+
+# Servidor local que responde à busca do Jira (GET /rest/api/2/search) com páginas de uma lista fixa
+# de itens. A JQL é ignorada. fail_rate devolve 503/429 aleatórios e latency atrasa cada resposta,
+# para exercitar as novas tentativas e a concorrência do cliente sem acesso à rede.
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, issues, fail_rate=0.0, latency=0.0, seed=0):
+        super().__init__(address, StubHandler)
+        self.issues = issues
+        self.fail_rate = fail_rate
+        self.latency = latency
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.failures = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f'http://{self.server_address[0]}:{self.server_address[1]}'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json;charset=UTF-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        if url.path != SEARCH_PATH:
+            self._send_json(404, {'errorMessages': [f'{url.path} não encontrado']})
+            return
+        with server.lock:
+            server.requests += 1
+            failure = server.random.random() < server.fail_rate
+            status = server.random.choice([429, 503]) if failure else 200
+            server.failures += failure
+        if server.latency:
+            time.sleep(server.latency)
+        if failure:
+            self._send_json(status, {'errorMessages': ['falha simulada']}, {'Retry-After': '0'} if status == 429 else None)
+            return
+        params = parse_qs(url.query)
+        start_at = int(params.get('startAt', ['0'])[0])
+        max_results = min(int(params.get('maxResults', ['50'])[0]), 1000)
+        issues = server.issues[start_at:start_at + max_results]
+        self._send_json(200, {'startAt': start_at, 'maxResults': max_results, 'total': len(server.issues),
+                              'issues': issues})
+
+    def log_message(self, format, *args):
+        pass
+
+
+# Inicia o stub em uma thread (porta 0 = livre) e retorna o servidor; server.shutdown() encerra
+def start_stub(issues, host='127.0.0.1', port=0, fail_rate=0.0, latency=0.0):
+    server = StubServer((host, port), issues, fail_rate, latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def read_fixture(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)['issues']
+
+
+def write_fixture(path, issues):
+    with open(path + '.tmp', 'w', encoding='utf-8') as file:
+        json.dump({'issues': issues}, file, ensure_ascii=False)
+    os.replace(path + '.tmp', path)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Servidor local que imita a busca da API REST do Jira')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--issues', type=int, default=1000, help='itens sintéticos gerados (sem --fixture)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--fixture', help='arquivo JSON com {"issues": [...]} servido no lugar dos sintéticos')
+    parser.add_argument('--write-fixture', help='grava os itens sintéticos neste arquivo e sai')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='fração de respostas 429/503')
+    parser.add_argument('--latency', type=float, default=0.0, help='atraso de cada resposta em segundos')
+    args = parser.parse_args()
+
+    itens = read_fixture(args.fixture) if args.fixture else fixture_issues(args.issues, args.seed)
+    if args.write_fixture:
+        write_fixture(args.write_fixture, itens)
+        print(f'{len(itens)} itens gravados em {args.write_fixture}')
+    else:
+        servidor = StubServer((args.host, args.port), itens, args.fail_rate, args.latency)
+        print(f'stub do Jira em {servidor.url}{SEARCH_PATH} ({len(itens)} itens)')
+        servidor.serve_forever()
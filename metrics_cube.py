@@ -0,0 +1,148 @@
+import pandas as pd
+
+from jira_schema import DATE_TEXT_SUFFIX
+from sla_metrics import DURATION_COLUMNS
+
+# Dimensões do cubo de métricas; 'Mês' é o início do mês de 'Criado'
+CUBE_DIMENSIONS = ['Mês', 'Tipo de item', 'Prioridade', 'Responsável', 'Status', 'Pai']
+
+# Colunas de tempo (dias corridos e horas úteis) somadas no cubo; a média é derivada de
+# soma / quantidade de itens com a medida (itens sem resposta ou sem solução não entram)
+TIME_MEASURES = DURATION_COLUMNS
+
+# Contagens somadas no cubo
+COUNT_MEASURES = ['Quantidade', 'Sem Data Pré/Produção', 'Com Data Pré ou Produção', 'Com Data Produção']
+
+# Tipos de item acompanhados nos gráficos de Data Pré / Data Produção
+RELEASE_ITEM_TYPES = ['Bug', 'Melhoria']
+
+
+def _sum_column(measure):
+    return f'Soma {measure}'
+
+
+def _mean_column(measure):
+    return f'Média {measure}'
+
+
+def _count_column(measure):
+    return f'Com {measure}'
+
+
+# Adiciona as médias (soma / quantidade com a medida) às linhas de um cubo ou de uma agregação dele;
+# sem nenhum item com a medida, a média fica NaN
+def _add_means(df):
+    for measure in TIME_MEASURES:
+        count = df[_count_column(measure)]
+        df[_mean_column(measure)] = df[_sum_column(measure)] / count.where(count > 0)
+    return df
+
+
+# Célula de data do backlog preenchida: com data ou com texto livre (ex.: 'Final de Agosto'), como na planilha
+def _filled(df, column):
+    filled = pd.Series(False, index=df.index)
+    for name in [column, column + DATE_TEXT_SUFFIX]:
+        if name in df.columns:
+            filled |= df[name].notnull()
+    return filled
+
+
+# Monta o cubo: uma linha por combinação de dimensões com contagens, somas e médias
+def build_cube(df):
+    data = pd.DataFrame({'Mês': df['Criado'].dt.to_period('M').dt.start_time})
+    for dimension in CUBE_DIMENSIONS[1:]:
+        data[dimension] = df[dimension]
+    data['Quantidade'] = 1
+    for measure in TIME_MEASURES:
+        data[_sum_column(measure)] = df[measure].astype('float64')
+        data[_count_column(measure)] = df[measure].notna().astype(int)
+
+    data_pre = _filled(df, 'Data Pré')
+    data_producao = _filled(df, 'Data Produção')
+    data['Sem Data Pré/Produção'] = (~data_pre & ~data_producao).astype(int)
+    data['Com Data Pré ou Produção'] = (data_pre | data_producao).astype(int)
+    data['Com Data Produção'] = data_producao.astype(int)
+
+    cube = data.groupby(CUBE_DIMENSIONS, dropna=False, observed=True).sum().reset_index()
+    return _add_means(cube)
+
+
+# Recorta o cubo pelos filtros do sidebar (None = sem filtro na dimensão)
+def slice_cube(cube, tipos=None, prioridades=None, responsaveis=None):
+    mask = pd.Series(True, index=cube.index)
+    if tipos is not None:
+        mask &= cube['Tipo de item'].isin(tipos)
+    if prioridades is not None:
+        mask &= cube['Prioridade'].isin(prioridades)
+    if responsaveis is not None:
+        mask &= cube['Responsável'].isin(responsaveis)
+    return cube[mask]
+
+
+# Agrega o cubo (ou um recorte) pelas dimensões pedidas, recalculando as médias
+def rollup(cube, by, dropna=True):
+    measures = COUNT_MEASURES + [column for measure in TIME_MEASURES
+                                 for column in (_sum_column(measure), _count_column(measure))]
+    result = cube.groupby(by, dropna=dropna, observed=True)[measures].sum().reset_index()
+    return _add_means(result)
+
+
+# Rótulo de mês usado nos gráficos ('2024-05'; 'NaT' quando não há data de criação)
+def month_label(months):
+    return months.dt.to_period('M').astype(str)
+
+
+# Tempo (média ou total) por mês e tipo de item (gráficos 4 e 5). As prioridades são somadas no
+# rollup: um ponto por mês em cada linha, em vez de um ponto por prioridade sobreposto na mesma linha
+def time_by_month(cube, measure, metric):
+    result = rollup(cube.assign(**{'Mês': month_label(cube['Mês'])}), ['Mês', 'Tipo de item'])
+    column = _mean_column(measure) if metric == 'Média' else _sum_column(measure)
+    result[column] = result[column].where(result[_count_column(measure)] > 0)
+    return result[['Mês', 'Tipo de item', column]].rename(columns={column: measure})
+
+
+# Quantidade de bugs e melhorias por mês sem Data Pré nem Data Produção (gráfico 6)
+def release_items_without_dates(cube):
+    cube = cube[cube['Tipo de item'].isin(RELEASE_ITEM_TYPES)]
+    result = rollup(cube.assign(**{'Mês': month_label(cube['Mês'])}), ['Mês', 'Tipo de item'])
+    result = result[result['Sem Data Pré/Produção'] > 0]
+    return result[['Mês', 'Tipo de item', 'Sem Data Pré/Produção']].rename(columns={'Sem Data Pré/Produção': 'Quantidade'})
+
+
+# Quantidade por mês com Data Pré ou Data Produção (gráfico 7). Mantém o critério original
+# do dashboard: bugs/melhorias com qualquer uma das datas, ou qualquer item com Data Produção.
+def release_items_with_dates(cube):
+    release_items = cube['Tipo de item'].isin(RELEASE_ITEM_TYPES)
+    cube = cube.assign(**{
+        'Mês': month_label(cube['Mês']),
+        'Com Data': cube['Com Data Pré ou Produção'].where(release_items, cube['Com Data Produção']),
+    })
+    result = cube.groupby(['Mês', 'Tipo de item'], observed=True)['Com Data'].sum().reset_index()
+    result = result[result['Com Data'] > 0]
+    return result.rename(columns={'Com Data': 'Quantidade'})
+
+
+# Quantidade de itens agrupada pelas dimensões pedidas (gráficos 1 e 2)
+def count_by(cube, by):
+    return rollup(cube, by)[by + ['Quantidade']].rename(columns={'Quantidade': 'Count'})
+
+
+# Itens criados por mês e tipo, com todos os meses do intervalo presentes (gráfico 3)
+def created_timeline(cube):
+    df_filtered = count_by(cube, ['Mês', 'Tipo de item']).rename(columns={'Mês': 'Criado'})
+
+    # Criar um índice com todos os meses no intervalo de datas
+    all_months = pd.date_range(start=df_filtered['Criado'].min(), end=df_filtered['Criado'].max(), freq='MS')
+
+    # Criar uma tabela pivô e reindexar para garantir todos os meses presentes
+    df_pivot = df_filtered.set_index(['Criado', 'Tipo de item'])['Count'].unstack(fill_value=0).reindex(all_months, fill_value=0, method=None).stack().reset_index(name='Count')
+
+    # Renomear a coluna 'level_0' de volta para 'Criado'
+    return df_pivot.rename(columns={'level_0': 'Criado'})
+
+
+# Período de cada versão, da criação do primeiro item até a maior Data Pré (gráfico 8).
+# Não vem do cubo: depende das datas do backlog de cada item.
+def version_timeline(jira_data):
+    df_versoes = jira_data[['Versão', 'Criado', 'Data Pré']].dropna(subset=['Versão', 'Criado', 'Data Pré'])
+    return df_versoes.groupby('Versão', observed=True).agg({'Criado': 'min', 'Data Pré': 'max'}).reset_index()
@@ -0,0 +1,172 @@
+import contextlib
+import datetime
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+
+from filelock import FileLock
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Diretório dos arquivos de métricas (JSON lines e formato texto do Prometheus)
+PERF_DIR = os.environ.get('DASHBOARD_PERF_DIR', 'perf')
+
+# Medir o pico de memória com tracemalloc deixa a execução mais lenta; ligado pela variável de
+# ambiente ou pelo painel de desempenho do dashboard
+TRACE_MEMORY = os.environ.get('DASHBOARD_PERF_MEMORY', '') == '1'
+
+JSONL_NAME = 'metrics.jsonl'
+PROMETHEUS_NAME = 'dashboard.prom'
+
+# Acima deste tamanho o histórico JSON lines vira metrics.jsonl.1 (só uma cópia antiga é mantida)
+JSONL_MAX_BYTES = int(os.environ.get('DASHBOARD_PERF_HISTORY_MB', 10)) * 2 ** 20
+
+# O tracemalloc é global no processo: as etapas medidas de todas as sessões passam por este lock,
+# uma de cada vez, para que uma sessão não zere nem infle o pico da outra
+_TRACE_LOCK = threading.RLock()
+
+
+# Pico de memória residente do processo (MB), quando o sistema informa
+def max_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 2 ** 10  # bytes no macOS, KB no Linux
+
+
+# Registra tempo, pico de memória e quantidade de linhas de cada etapa de uma execução.
+# As etapas são medidas em sequência (não aninhadas), como no roteiro do dashboard.
+# Com trace_memory, o tracemalloc só fica ligado durante cada etapa (ligado no início e desligado
+# no fim), então execuções sem o painel não pagam o custo do rastreamento. As etapas medidas são
+# serializadas entre as sessões; os picos valem para a etapa, não para o processo.
+class PerfRecorder:
+    def __init__(self, source='dashboard', trace_memory=TRACE_MEMORY):
+        self.source = source
+        self.run_id = uuid.uuid4().hex[:12]
+        self.started = datetime.datetime.now().isoformat(timespec='seconds')
+        self.trace_memory = trace_memory
+        self.records = []
+        self._start = time.perf_counter()
+
+    # Uso: with recorder.stage('gráfico 1') as record: ...; record['rows'] = len(df)
+    @contextlib.contextmanager
+    def stage(self, name, rows=None):
+        record = {'stage': name, 'rows': rows}
+        with _TRACE_LOCK if self.trace_memory else contextlib.nullcontext():
+            # Se o rastreamento já estava ligado (ex.: python -X tracemalloc), ele é mantido
+            started = self.trace_memory and not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start()
+            if self.trace_memory:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            try:
+                yield record
+            finally:
+                record['seconds'] = time.perf_counter() - start
+                record['peak_mb'] = None
+                if self.trace_memory:
+                    record['peak_mb'] = max(tracemalloc.get_traced_memory()[1] - baseline, 0) / 2 ** 20
+                if started:
+                    tracemalloc.stop()
+                record['rss_mb'] = max_rss_mb()
+                self.records.append(record)
+
+    def total_seconds(self):
+        return time.perf_counter() - self._start
+
+    # Etapas em forma de tabela (para o painel do dashboard)
+    def to_frame(self):
+        import pandas as pd
+        return pd.DataFrame(self.records, columns=['stage', 'seconds', 'peak_mb', 'rows', 'bytes', 'rss_mb'])
+
+    # Acrescenta uma linha JSON por etapa ao histórico (rotacionado em JSONL_MAX_BYTES) e regrava o
+    # arquivo do Prometheus
+    def write(self, perf_dir=PERF_DIR, max_bytes=JSONL_MAX_BYTES):
+        os.makedirs(perf_dir, exist_ok=True)
+        path = os.path.join(perf_dir, JSONL_NAME)
+        with FileLock(path + '.lock'):
+            if os.path.exists(path) and os.path.getsize(path) >= max_bytes:
+                os.replace(path, path + '.1')
+            with open(path, 'a', encoding='utf-8') as file:
+                for record in self.records:
+                    line = {'run_id': self.run_id, 'started': self.started, 'source': self.source, **record}
+                    file.write(json.dumps(line, ensure_ascii=False) + '\n')
+        write_prometheus(os.path.join(perf_dir, PROMETHEUS_NAME), self)
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value):
+    return 'NaN' if value is None else repr(float(value))
+
+
+# Uma linha por etapa: a mesma etapa registrada mais de uma vez na execução é somada (tempo, linhas e
+# bytes) e fica com o maior pico. Séries repetidas fazem o textfile collector rejeitar o arquivo inteiro.
+def _stage_totals(records):
+    totals = {}
+    for record in records:
+        total = totals.setdefault(record['stage'], {'stage': record['stage']})
+        for field in ('seconds', 'rows', 'bytes', 'peak_mb'):
+            value = record.get(field)
+            if value is None:
+                total.setdefault(field, None)
+            elif total.get(field) is None:
+                total[field] = value
+            else:
+                total[field] = max(total[field], value) if field == 'peak_mb' else total[field] + value
+    return list(totals.values())
+
+
+# Métricas da última execução no formato texto do Prometheus (para o textfile collector do node_exporter)
+def write_prometheus(path, recorder):
+    metrics = [
+        ('dashboard_stage_seconds', 'Tempo de cada etapa em segundos', 'seconds', 1),
+        ('dashboard_stage_peak_bytes', 'Pico de memória alocada em cada etapa (tracemalloc)', 'peak_mb', 2 ** 20),
+        ('dashboard_stage_rows', 'Linhas produzidas por cada etapa', 'rows', 1),
+        ('dashboard_stage_bytes', 'Bytes enviados ao navegador por cada etapa (JSON das figuras)', 'bytes', 1),
+    ]
+    stages = _stage_totals(recorder.records)
+    lines = []
+    for metric, description, field, scale in metrics:
+        lines.append(f'# HELP {metric} {description}')
+        lines.append(f'# TYPE {metric} gauge')
+        for record in stages:
+            if record.get(field) is None:
+                continue
+            labels = f'source="{_label(recorder.source)}",stage="{_label(record["stage"])}"'
+            lines.append(f'{metric}{{{labels}}} {_number(record[field] * scale)}')
+
+    source = f'source="{_label(recorder.source)}"'
+    lines += [
+        '# HELP dashboard_run_seconds Tempo total da execução em segundos',
+        '# TYPE dashboard_run_seconds gauge',
+        f'dashboard_run_seconds{{{source}}} {_number(recorder.total_seconds())}',
+        '# HELP dashboard_run_timestamp_seconds Início da execução (epoch)',
+        '# TYPE dashboard_run_timestamp_seconds gauge',
+        f'dashboard_run_timestamp_seconds{{{source}}} {_number(datetime.datetime.fromisoformat(recorder.started).timestamp())}',
+    ]
+    rss = max_rss_mb()
+    if rss is not None:
+        lines += [
+            '# HELP dashboard_process_max_rss_bytes Pico de memória residente do processo',
+            '# TYPE dashboard_process_max_rss_bytes gauge',
+            f'dashboard_process_max_rss_bytes{{{source}}} {_number(rss * 2 ** 20)}',
+        ]
+
+    # Temporário com nome único no mesmo diretório: execuções simultâneas não gravam no mesmo arquivo
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(path) or '.', prefix=PROMETHEUS_NAME,
+                                     suffix='.tmp', delete=False) as file:
+        file.write('\n'.join(lines) + '\n')
+    os.replace(file.name, path)
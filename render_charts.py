@@ -0,0 +1,265 @@
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from jira_cache import cached_frame
+from jira_html import PARSER_VERSION
+from jira_loader import LOADER_VERSION, export_paths, load_exports
+
+# Versão dos desenhos; mudar força a regeração de todos os arquivos
+RENDER_VERSION = '1'
+
+MANIFEST_NAME = '.render_manifest.json'
+
+# Abreviações de mês em português, sem depender do locale pt_BR do sistema
+MESES = ['jan', 'fev', 'mar', 'abr', 'mai', 'jun', 'jul', 'ago', 'set', 'out', 'nov', 'dez']
+
+
+# ---- Preparação dos dados (processo principal) ----
+
+def prepare_pai_item_status(df):
+    return df.groupby(['Pai', 'Tipo de item', 'Status'], observed=True).size().reset_index(name='Count')
+
+
+def prepare_responsavel_item(df):
+    return df.groupby(['Responsável', 'Tipo de item'], observed=True).size().reset_index(name='Count')
+
+
+def prepare_modulos_tipo_item(df):
+    return df.groupby(['Pai', 'Tipo de item'], observed=True).size().reset_index(name='Count')
+
+
+def prepare_timeline(df):
+    df_filtered = df.dropna(subset=['Criado'])
+    return df_filtered.groupby([pd.Grouper(key='Criado', freq='ME'), 'Tipo de item'], observed=True).size().reset_index(name='Count')
+
+
+# ---- Desenho (processos do pool, backend não interativo) ----
+
+def _pyplot():
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+# Adicionando o valor total acima de cada barra
+def _annotate_bars(ax):
+    for p in ax.patches:
+        ax.annotate(format(p.get_height(), '.1f'),
+                    (p.get_x() + p.get_width() / 2., p.get_height()),
+                    ha='center', va='center',
+                    xytext=(0, 9),
+                    textcoords='offset points')
+
+
+def render_pai_item_status(data, output_path):
+    plt = _pyplot()
+    import seaborn as sns
+
+    plt.figure(figsize=(12, 6))
+    bar_plot = sns.barplot(x='Pai', y='Count', hue='Status', data=data, errorbar=None)
+    _annotate_bars(bar_plot)
+    plt.title('Quantidade de itens por Tipo de Item e Status para cada Pai')
+    plt.xlabel('Módulo')
+    plt.ylabel('Quantidade de Itens')
+    plt.legend(title='Status')
+    plt.xticks(rotation=90)
+    plt.tight_layout()
+    plt.savefig(output_path)
+    plt.close()
+
+
+def render_responsavel_item(data, output_path):
+    plt = _pyplot()
+    import seaborn as sns
+
+    plt.figure(figsize=(12, 6))
+    stacked_bar = sns.barplot(x='Responsável', y='Count', hue='Tipo de item', data=data)
+    _annotate_bars(stacked_bar)
+    plt.title('Distribuição de Responsável por Tipo de Item')
+    plt.xlabel('Responsável')
+    plt.ylabel('Quantidade de Itens')
+    plt.legend(title='Tipo de Item')
+    plt.xticks(rotation=90)
+    plt.tight_layout()
+    plt.savefig(output_path)
+    plt.close()
+
+
+def render_modulos_tipo_item(data, output_path):
+    plt = _pyplot()
+    import seaborn as sns
+
+    plt.figure(figsize=(12, 6))
+    sns.barplot(x='Pai', y='Count', hue='Tipo de item', data=data, errorbar=None)
+    plt.title('Quantidade de itens por Tipo de Item e Módulos')
+    plt.xlabel('Módulos')
+    plt.ylabel('Quantidade de Itens')
+    plt.legend(title='Tipo de Item')
+    plt.xticks(rotation=90)
+    plt.tight_layout()
+    plt.savefig(output_path)
+    plt.close()
+
+
+def render_timeline(data, output_path):
+    plt = _pyplot()
+    import matplotlib.dates as mdates
+    from matplotlib.ticker import FuncFormatter
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+    for item_type, group in data.groupby('Tipo de item', observed=True, sort=False):
+        series = group.set_index('Criado')['Count'].asfreq('ME', fill_value=0)
+        ax.plot(series.index, series.values, marker='o', label=item_type)
+
+        # Adicionando o valor total em cada ponto da linha do tempo
+        for (x, y) in series.items():
+            ax.text(x, y, str(y), color='black', ha='right', va='bottom')
+
+    def month_name(value, _):
+        date = mdates.num2date(value)
+        return f'{MESES[date.month - 1]}\n{date.year}'
+
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    ax.xaxis.set_major_formatter(FuncFormatter(month_name))
+    ax.set_title('Linha do Tempo de Itens Criados por Tipo de Item')
+    ax.set_xlabel('Data')
+    ax.set_ylabel('Quantidade de Itens Criados')
+    ax.legend(title='Tipo de Item')
+    ax.grid(True)
+    fig.tight_layout()
+    fig.savefig(output_path)
+    plt.close(fig)
+
+
+def render_plotly_pai_item_status(data, output_path):
+    import plotly.express as px
+
+    fig = px.bar(data, x='Pai', y='Count', color='Status',
+                 title='Quantidade de itens por Tipo de Item e Status para cada Pai',
+                 labels={'Count': 'Quantidade de Itens', 'Pai': 'Módulo', 'Status': 'Status'})
+    fig.write_html(output_path, include_plotlyjs='cdn')
+
+
+def render_plotly_responsavel_item(data, output_path):
+    import plotly.express as px
+
+    fig = px.bar(data, x='Responsável', y='Count', color='Tipo de item',
+                 title='Distribuição de Responsável por Tipo de Item',
+                 labels={'Count': 'Quantidade de Itens', 'Responsável': 'Responsável', 'Tipo de item': 'Tipo de Item'})
+    fig.write_html(output_path, include_plotlyjs='cdn')
+
+
+def render_plotly_timeline(data, output_path):
+    import plotly.express as px
+
+    fig = px.line(data, x='Criado', y='Count', color='Tipo de item',
+                  title='Linha do Tempo de Itens Criados por Tipo de Item',
+                  labels={'Criado': 'Data', 'Count': 'Quantidade de Itens Criados', 'Tipo de item': 'Tipo de Item'})
+    fig.update_xaxes(dtick="M1", tickformat="%b\n%Y")  # Formatação do eixo X para mostrar o mês e o ano
+    fig.write_html(output_path, include_plotlyjs='cdn')
+
+
+# Conjunto de gráficos estáticos: arquivo de saída -> (preparação, desenho)
+CHARTS = {
+    'BarPlot_Pai_Item_Status.png': (prepare_pai_item_status, render_pai_item_status),
+    'StackedBarPlot_Responsavel_Item.png': (prepare_responsavel_item, render_responsavel_item),
+    'Timeline_Creation_Items.png': (prepare_timeline, render_timeline),
+    'BarPlot_Modulos_Tipo_Item.png': (prepare_modulos_tipo_item, render_modulos_tipo_item),
+    'BarPlot_Pai_Item_Status.html': (prepare_pai_item_status, render_plotly_pai_item_status),
+    'StackedBarPlot_Responsavel_Item.html': (prepare_responsavel_item, render_plotly_responsavel_item),
+    'Timeline_Creation_Items.html': (prepare_timeline, render_plotly_timeline),
+}
+
+
+# Impressão digital dos dados de entrada de um gráfico (conteúdo + colunas + versão do desenho)
+def fingerprint(data, chart_name):
+    digest = hashlib.sha256(f'{RENDER_VERSION}:{chart_name}:{list(data.columns)}'.encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(data.astype(object), index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+def _read_manifest(output_dir):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def _write_manifest(output_dir, manifest):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    with open(path + '.tmp', 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+    os.replace(path + '.tmp', path)
+
+
+# Executado em cada processo do pool
+def _render_job(render, data, output_path):
+    start = time.perf_counter()
+    render(data, output_path)
+    return time.perf_counter() - start
+
+
+# Carrega os itens das exportações (HTML ou CSV; arquivo, diretório ou glob) pelo cache colunar
+def load_issues(export_path):
+    version = f'{PARSER_VERSION}-{LOADER_VERSION}'
+    paths = export_paths(export_path)
+    return cached_frame('issues', paths, version, lambda: load_exports(paths))
+
+
+# Gera todos os gráficos em output_dir, pulando os que têm os mesmos dados de entrada
+def render_all(export_path, output_dir='.', charts=None, max_workers=None, force=False):
+    os.makedirs(output_dir, exist_ok=True)
+    issues = load_issues(export_path)
+    manifest = _read_manifest(output_dir)
+
+    jobs = {}
+    skipped = []
+    for chart_name in charts or CHARTS:
+        prepare, render = CHARTS[chart_name]
+        data = prepare(issues)
+        chart_fingerprint = fingerprint(data, chart_name)
+        output_path = os.path.join(output_dir, chart_name)
+        if not force and manifest.get(chart_name) == chart_fingerprint and os.path.exists(output_path):
+            skipped.append(chart_name)
+            continue
+        jobs[chart_name] = (render, data, output_path, chart_fingerprint)
+
+    rendered = {}
+    if jobs:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {name: pool.submit(_render_job, render, data, path) for name, (render, data, path, _) in jobs.items()}
+            for name, future in futures.items():
+                rendered[name] = round(future.result(), 3)
+                manifest[name] = jobs[name][3]
+        _write_manifest(output_dir, manifest)
+    return {'gerados': rendered, 'sem_mudancas': skipped}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Gera os gráficos estáticos do Jira em lote (sem interface gráfica)')
+    parser.add_argument('--export', default='Jira (3).html', help='exportação do Jira em HTML ou CSV (arquivo, diretório ou glob)')
+    parser.add_argument('--output-dir', default='.', help='diretório de saída dos gráficos')
+    parser.add_argument('--chart', action='append', choices=list(CHARTS), help='gera apenas este gráfico (pode repetir)')
+    parser.add_argument('--workers', type=int, default=None, help='quantidade de processos (padrão: número de CPUs)')
+    parser.add_argument('--force', action='store_true', help='regera mesmo se os dados não mudaram')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    result = render_all(args.export, args.output_dir, args.chart, args.workers, args.force)
+    for name, seconds in result['gerados'].items():
+        print(f'gerado: {name} ({seconds}s)')
+    for name in result['sem_mudancas']:
+        print(f'sem mudanças: {name}')
+    print(f'total: {time.perf_counter() - start:.2f}s')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+import argparse
+import os
+import tempfile
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.dates as mdates
+import matplotlib.pyplot as plt
+import pandas as pd
+from matplotlib.backends.backend_pdf import PdfPages
+
+from metrics_cube import (count_by, created_timeline, release_items_with_dates, release_items_without_dates, slice_cube,
+                          time_by_month, version_timeline)
+from sla_metrics import DURATION_UNITS
+
+# Página A4 em paisagem (polegadas)
+PAGE_SIZE = (11.69, 8.27)
+
+# Tabela: linhas por página, tamanho da fonte, caracteres por linha e peso (largura) das colunas
+TABLE_ROWS_PER_PAGE = 40
+TABLE_FONT_SIZE = 6
+TABLE_LINE_CHARS = 210
+TABLE_COLUMN_WEIGHTS = {'Chave': 1, 'Status': 1.2, 'Resumo': 3, 'Descrição': 3, 'Responsável': 1.2}
+
+# Linhas da tabela no relatório baixado pelo dashboard (o resto é omitido com um aviso); a linha de
+# comando gera a tabela inteira
+REPORT_TABLE_MAX_ROWS = int(os.environ.get('DASHBOARD_REPORT_TABLE_ROWS', 2000))
+
+# Colunas da tabela de itens filtrados (as mesmas do dashboard)
+TABLE_COLUMNS = ['Chave', 'Status', 'Resumo', 'Descrição', 'Análise x Documentação/Desenvolvimento/QA/Entrega', 'Responsável']
+
+RELEASE_COLORS = {'Melhoria': 'blue', 'Bug': 'red'}
+
+
+def _new_page(title):
+    fig, ax = plt.subplots(figsize=PAGE_SIZE)
+    ax.set_title(title)
+    return fig, ax
+
+
+# Cada página é gravada no arquivo assim que termina e a figura é liberada em seguida
+def _save_page(pdf, fig):
+    fig.tight_layout()
+    pdf.savefig(fig)
+    plt.close(fig)
+
+
+def _bar_page(pdf, title, data, x, y, hue, xlabel, ylabel, colors=None):
+    fig, ax = _new_page(title)
+    if not data.empty:
+        pivot = data.pivot_table(index=x, columns=hue, values=y, aggfunc='sum', fill_value=0, observed=True)
+        color = [colors.get(column, None) for column in pivot.columns] if colors else None
+        pivot.plot(kind='bar', ax=ax, color=color, width=0.8)
+        ax.legend(title=hue)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.tick_params(axis='x', labelrotation=90)
+    _save_page(pdf, fig)
+
+
+def _line_page(pdf, title, data, x, y, hue, xlabel, ylabel):
+    fig, ax = _new_page(title)
+    for name, group in data.groupby(hue, observed=True, sort=False):
+        ax.plot(group[x].astype(str), group[y], marker='o', label=name)
+    if not data.empty:
+        ax.legend(title=hue)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.tick_params(axis='x', labelrotation=90)
+    ax.grid(True)
+    _save_page(pdf, fig)
+
+
+def _versions_page(pdf, title, data):
+    fig, ax = _new_page(title)
+    data = data.dropna(subset=['Criado', 'Data Pré'])
+    start = mdates.date2num(data['Criado'])
+    end = mdates.date2num(data['Data Pré'])
+    ax.barh(data['Versão'].astype(str), end - start, left=start)
+    ax.xaxis_date()
+    ax.set_xlabel('Data')
+    ax.set_ylabel('Versão')
+    _save_page(pdf, fig)
+
+
+def _cell_text(value, max_chars):
+    if pd.isna(value):
+        return ''
+    text = ' '.join(str(value).split())
+    return text if len(text) <= max_chars else text[:max_chars - 1] + '…'
+
+
+# Tabela em várias páginas. Cada coluna da página é um único bloco de texto monoespaçado
+# (bem mais rápido que matplotlib.table) e as linhas só viram texto na página em que aparecem.
+# Com max_rows, só as primeiras linhas entram e a primeira página avisa quantas ficaram de fora.
+def _table_pages(pdf, title, table, max_rows=None):
+    omitted = max(len(table) - max_rows, 0) if max_rows is not None else 0
+    if omitted:
+        table = table.iloc[:max_rows]
+    weights = [TABLE_COLUMN_WEIGHTS.get(column, 1) for column in table.columns]
+    widths = [weight / sum(weights) for weight in weights]
+    max_chars = [max(int(width * TABLE_LINE_CHARS), 4) for width in widths]
+
+    total = len(table)
+    pages = max((total + TABLE_ROWS_PER_PAGE - 1) // TABLE_ROWS_PER_PAGE, 1)
+    for page in range(pages):
+        rows = table.iloc[page * TABLE_ROWS_PER_PAGE:(page + 1) * TABLE_ROWS_PER_PAGE]
+        fig = plt.figure(figsize=PAGE_SIZE)
+        fig.suptitle(f'{title} ({page + 1}/{pages})')
+        if rows.empty:
+            fig.text(0.5, 0.5, 'Nenhum item encontrado.', ha='center', va='center')
+        if omitted and page == 0:
+            fig.text(0.03, 0.95, f'Mostrando os primeiros {total} de {total + omitted} itens. '
+                     'A tabela completa é gerada por python report_pdf.py.', ha='left', va='top', fontsize=8)
+        left = 0.03
+        for column, width, chars in zip(table.columns, widths, max_chars):
+            lines = [_cell_text(column, chars), '-' * chars]
+            lines += [_cell_text(value, chars) for value in rows[column]]
+            fig.text(left, 0.92, '\n'.join(lines), ha='left', va='top', family='monospace', fontsize=TABLE_FONT_SIZE)
+            left += width * 0.94
+        pdf.savefig(fig)
+        plt.close(fig)
+
+
+# Gera o relatório em PDF a partir do cubo de métricas e dos itens já carregados.
+# output pode ser um caminho ou um arquivo aberto em modo binário; max_table_rows limita a tabela.
+def write_report(output, cube, jira_data, tipos=None, prioridades=None, responsaveis=None, metrica='Média',
+                 tipo_tabela=None, unidade='Dias corridos', max_table_rows=None):
+    cubo_filtrado = slice_cube(cube, tipos, prioridades, responsaveis)
+    rotulo, (resposta, solucao) = DURATION_UNITS[unidade]
+    sufixo = f'Média em {rotulo}' if metrica == 'Média' else f'Total em {rotulo}'
+
+    with PdfPages(output) as pdf:
+        _bar_page(pdf, 'Quantidade de itens por Tipo de Item e Status para cada Módulo',
+                  count_by(cube, ['Pai', 'Status']), 'Pai', 'Count', 'Status', 'Módulo', 'Quantidade de Itens')
+        _bar_page(pdf, 'Distribuição de Responsável por Tipo de Item',
+                  count_by(cubo_filtrado, ['Responsável', 'Tipo de item']), 'Responsável', 'Count', 'Tipo de item',
+                  'Responsável', 'Quantidade de Itens')
+        _line_page(pdf, 'Linha do Tempo de Itens Criados por Tipo de Item',
+                   created_timeline(cube).assign(Criado=lambda df: df['Criado'].dt.strftime('%Y-%m')),
+                   'Criado', 'Count', 'Tipo de item', 'Data', 'Quantidade de Itens Criados')
+        _line_page(pdf, f'{resposta} por Mês ({sufixo})', time_by_month(cubo_filtrado, resposta, metrica),
+                   'Mês', resposta, 'Tipo de item', 'Mês', resposta)
+        _line_page(pdf, f'{solucao} por Mês ({sufixo})', time_by_month(cubo_filtrado, solucao, metrica),
+                   'Mês', solucao, 'Tipo de item', 'Mês', solucao)
+        _bar_page(pdf, 'Quantidade de Bugs e Melhorias sem Data Pré ou Data Produção por Mês',
+                  release_items_without_dates(cubo_filtrado), 'Mês', 'Quantidade', 'Tipo de item', 'Mês', 'Quantidade',
+                  RELEASE_COLORS)
+        _bar_page(pdf, 'Quantidade de Bugs e Melhorias com Data Pré ou Data Produção por Mês',
+                  release_items_with_dates(cubo_filtrado), 'Mês', 'Quantidade', 'Tipo de item', 'Mês', 'Quantidade',
+                  RELEASE_COLORS)
+        _versions_page(pdf, 'Linha do Tempo das Versões', version_timeline(jira_data))
+
+        colunas_presentes = [col for col in TABLE_COLUMNS if col in jira_data.columns]
+        if tipo_tabela is not None:
+            itens = jira_data[jira_data['Tipo de item'] == tipo_tabela]
+        else:
+            itens = jira_data
+            if tipos is not None:
+                itens = itens[itens['Tipo de item'].isin(tipos)]
+            if prioridades is not None:
+                itens = itens[itens['Prioridade'].isin(prioridades)]
+            if responsaveis is not None:
+                itens = itens[itens['Responsável'].isin(responsaveis)]
+        _table_pages(pdf, 'Tabela de Itens Filtrados', itens[colunas_presentes], max_table_rows)
+
+        info = pdf.infodict()
+        info['Title'] = 'Dashboard de Análise de Dados do Jira'
+
+
+# Relatório do botão de download do dashboard: as páginas vão direto para um arquivo temporário (não
+# para a memória) e a tabela é limitada a REPORT_TABLE_MAX_ROWS linhas. Retorna o caminho do arquivo,
+# que o chamador remove depois de usar.
+def report_file(cube, jira_data, max_table_rows=REPORT_TABLE_MAX_ROWS, **filtros):
+    with tempfile.NamedTemporaryFile(prefix='relatorio-', suffix='.pdf', delete=False) as file:
+        path = file.name
+    try:
+        write_report(path, cube, jira_data, max_table_rows=max_table_rows, **filtros)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path
+
+
+def main(argv=None):
+    from jira_store import EXPORT_SOURCES, ingest, load_store_cube, load_store_dashboard_data, segment_paths, STORE_DIR
+
+    parser = argparse.ArgumentParser(description='Gera o relatório PDF do dashboard do Jira')
+    parser.add_argument('--output', default='relatorio.pdf')
+    parser.add_argument('--backlog', default='backlog.xlsx')
+    parser.add_argument('--store', default=STORE_DIR)
+    parser.add_argument('--tipo', action='append', help='filtra o tipo de item (pode repetir)')
+    parser.add_argument('--prioridade', action='append', help='filtra a prioridade (pode repetir)')
+    parser.add_argument('--responsavel', action='append', help='filtra o responsável (pode repetir)')
+    parser.add_argument('--metrica', choices=['Média', 'Total'], default='Média')
+    parser.add_argument('--unidade', choices=list(DURATION_UNITS), default='Dias corridos')
+    parser.add_argument('--tipo-tabela', help='tipo de item mostrado na tabela (padrão: itens dos filtros)')
+    args = parser.parse_args(argv)
+
+    if not segment_paths(args.store):
+        ingest(EXPORT_SOURCES, args.store)
+    jira_data = load_store_dashboard_data(args.backlog, args.store)
+    cube = load_store_cube(args.backlog, args.store)
+    write_report(args.output, cube, jira_data, args.tipo, args.prioridade, args.responsavel, args.metrica,
+                 args.tipo_tabela, args.unidade)
+    print(f'relatório gerado: {args.output}')
+
+
+if __name__ == "__main__":
+    main()
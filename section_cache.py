@@ -0,0 +1,68 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+# Limite de memória das seções memorizadas do dashboard (agregados + figuras)
+SECTION_CACHE_MAX_BYTES = int(os.environ.get('DASHBOARD_SECTION_CACHE_MB', 64)) * 2 ** 20
+
+
+# Tamanho aproximado de um valor guardado: DataFrames pela memória das colunas,
+# figuras do Plotly pelo JSON que é enviado ao navegador
+def estimate_size(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if hasattr(value, 'to_json') and hasattr(value, 'to_plotly_json'):
+        return len(value.to_json())
+    if isinstance(value, (tuple, list)):
+        return sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+# Cache LRU limitado pela soma dos tamanhos dos valores, compartilhado entre as sessões
+class LRUCache:
+    def __init__(self, max_bytes=SECTION_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key][0]
+
+    # Guarda o valor e remove os menos usados até caber no limite; valores maiores que o limite não são guardados
+    def put(self, key, value):
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self.bytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return value
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, removed) = self._entries.popitem(last=False)
+                self.bytes -= removed
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {'entradas': len(self._entries), 'bytes': self.bytes, 'limite': self.max_bytes,
+                    'acertos': self.hits, 'faltas': self.misses}
@@ -0,0 +1,184 @@
+import datetime
+import os
+
+import numpy as np
+import pandas as pd
+
+FIRST_RESPONSE_DAYS = 'Tempo da Primeira Resposta'
+SOLUTION_DAYS = 'Tempo de Solução'
+FIRST_RESPONSE_HOURS = 'Tempo Útil da Primeira Resposta'
+SOLUTION_HOURS = 'Tempo Útil de Solução'
+
+# Colunas de duração calculadas na carga (dias corridos e horas úteis); vazias quando falta alguma data
+DURATION_COLUMNS = [FIRST_RESPONSE_DAYS, SOLUTION_DAYS, FIRST_RESPONSE_HOURS, SOLUTION_HOURS]
+
+# Unidades de tempo dos gráficos: rótulo dos títulos e colunas (primeira resposta, solução)
+DURATION_UNITS = {
+    'Dias corridos': ('dias', [FIRST_RESPONSE_DAYS, SOLUTION_DAYS]),
+    'Horas úteis': ('horas úteis', [FIRST_RESPONSE_HOURS, SOLUTION_HOURS]),
+}
+
+# Expediente ('HH:MM-HH:MM') e dias úteis da semana (segunda a sexta)
+BUSINESS_HOURS = os.environ.get('DASHBOARD_BUSINESS_HOURS', '09:00-18:00')
+WEEKMASK = '1111100'
+
+# Feriados locais além dos nacionais: arquivo com uma data (AAAA-MM-DD) por linha; '#' inicia comentário
+HOLIDAYS_FILE = os.environ.get('DASHBOARD_HOLIDAYS_FILE')
+
+# Feriados nacionais de data fixa (mês, dia); o Dia da Consciência Negra é nacional desde 2024
+FIXED_HOLIDAYS = [(1, 1), (4, 21), (5, 1), (9, 7), (10, 12), (11, 2), (11, 15), (12, 25)]
+
+# Feriados móveis em dias a partir da Páscoa: segunda e terça de Carnaval, Sexta-feira Santa, Corpus Christi
+EASTER_OFFSETS = [-48, -47, -2, 60]
+
+
+# Domingo de Páscoa (algoritmo de Meeus/Jones/Butcher, calendário gregoriano)
+def easter(year):
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return datetime.date(year, month, day + 1)
+
+
+def national_holidays(years):
+    holidays = []
+    for year in years:
+        holidays += [datetime.date(year, month, day) for month, day in FIXED_HOLIDAYS]
+        if year >= 2024:
+            holidays.append(datetime.date(year, 11, 20))
+        holidays += [easter(year) + datetime.timedelta(days=offset) for offset in EASTER_OFFSETS]
+    return holidays
+
+
+def read_holidays(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        lines = [line.split('#', 1)[0].strip() for line in file]
+    return [datetime.date.fromisoformat(line) for line in lines if line]
+
+
+# Calendário de dias úteis (numpy) com os feriados dos anos pedidos
+def business_calendar(years, holidays_file=HOLIDAYS_FILE):
+    holidays = national_holidays(years) + (read_holidays(holidays_file) if holidays_file else [])
+    return np.busdaycalendar(weekmask=WEEKMASK, holidays=np.array(holidays, dtype='datetime64[D]'))
+
+
+# Início e fim do expediente em horas ('09:00-18:00' -> (9.0, 18.0))
+def parse_business_hours(text=BUSINESS_HOURS):
+    opening, closing = (int(hour) + int(minute) / 60 for hour, minute in (part.split(':') for part in text.split('-')))
+    return opening, closing
+
+
+def _datetimes(values):
+    return pd.to_datetime(pd.Series(values)).to_numpy(dtype='datetime64[ns]')
+
+
+# Horas do expediente já passadas no dia de cada data (0 em dias não úteis)
+def _hours_into_day(values, days, calendar, opening, closing):
+    hours = (values - days.astype('datetime64[ns]')) / np.timedelta64(1, 'h')
+    return np.clip(hours - opening, 0, closing - opening) * np.is_busday(days, busdaycal=calendar)
+
+
+# Horas úteis entre start e end para todas as linhas de uma vez: dias úteis inteiros entre as duas
+# datas (np.busday_count) vezes a duração do expediente, menos o que já tinha passado do expediente
+# no dia do início, mais o que passou no dia do fim. Sem alguma das datas, ou com fim antes do
+# início, o resultado é NaN.
+def business_hours(start, end, calendar=None, business_hours_text=BUSINESS_HOURS):
+    start, end = _datetimes(start), _datetimes(end)
+    opening, closing = parse_business_hours(business_hours_text)
+    result = np.full(len(start), np.nan)
+    valid = ~np.isnat(start) & ~np.isnat(end)
+    valid[valid] = end[valid] >= start[valid]
+    if not valid.any():
+        return result
+    start, end = start[valid], end[valid]
+    start_days, end_days = start.astype('datetime64[D]'), end.astype('datetime64[D]')
+    if calendar is None:
+        years = range(start_days.min().astype(object).year, end_days.max().astype(object).year + 1)
+        calendar = business_calendar(years)
+    days = np.busday_count(start_days, end_days, busdaycal=calendar)
+    result[valid] = (days * (closing - opening)
+                     - _hours_into_day(start, start_days, calendar, opening, closing)
+                     + _hours_into_day(end, end_days, calendar, opening, closing))
+    return result
+
+
+# Dias corridos (com fração) entre start e end; NaN sem alguma das datas ou com fim antes do início
+def calendar_days(start, end):
+    start, end = _datetimes(start), _datetimes(end)
+    days = (end - start) / np.timedelta64(1, 'D')
+    days[~(end >= start)] = np.nan
+    return days
+
+
+# Calcula as colunas de duração a partir de 'Criado', da primeira resposta e de 'Resolvido'.
+# Itens sem resposta ou não resolvidos ficam com NaN (antes viravam 0 e puxavam as médias para baixo).
+def add_duration_columns(df):
+    created, response, resolved = df['Criado'], df['[CHART] Date of First Response'], df['Resolvido']
+    dates = pd.concat([created, response, resolved]).dropna()
+    years = range(dates.min().year, dates.max().year + 1) if len(dates) else []
+    calendar = business_calendar(years)
+    df[FIRST_RESPONSE_DAYS] = calendar_days(created, response)
+    df[SOLUTION_DAYS] = calendar_days(created, resolved)
+    df[FIRST_RESPONSE_HOURS] = business_hours(created, response, calendar)
+    df[SOLUTION_HOURS] = business_hours(created, resolved, calendar)
+    return df
+
+
+# Versão linha a linha, hora a hora (referência para conferir a vetorizada)
+def _business_hours_loop(start, end, calendar, business_hours_text=BUSINESS_HOURS):
+    opening, closing = parse_business_hours(business_hours_text)
+    result = []
+    for begin, finish in zip(start, end):
+        if pd.isna(begin) or pd.isna(finish) or finish < begin:
+            result.append(np.nan)
+            continue
+        total = 0.0
+        day = begin.normalize()
+        while day <= finish:
+            if np.is_busday(day.date(), busdaycal=calendar):
+                window_start = max(begin, day + pd.Timedelta(hours=opening))
+                window_end = min(finish, day + pd.Timedelta(hours=closing))
+                total += max((window_end - window_start) / pd.Timedelta(hours=1), 0)
+            day += pd.Timedelta(days=1)
+        result.append(total)
+    return np.array(result)
+
+
+# Compara a versão linha a linha com a vetorizada em datas sintéticas
+def benchmark(rows=100_000, seed=0):
+    import time
+
+    rng = np.random.default_rng(seed)
+    created = pd.Series(pd.to_datetime('2022-01-01') + pd.to_timedelta(rng.integers(0, 3 * 365 * 24 * 60, rows), unit='min'))
+    resolved = created + pd.to_timedelta(rng.exponential(9 * 24 * 60, rows).astype(int), unit='min')
+    resolved[rng.random(rows) < 0.3] = pd.NaT  # itens não resolvidos
+    calendar = business_calendar(range(2022, 2027))
+
+    start = time.perf_counter()
+    vetorizado = business_hours(created, resolved, calendar)
+    tempo_vetorizado = time.perf_counter() - start
+
+    amostra = min(rows, 5000)
+    start = time.perf_counter()
+    linha_a_linha = _business_hours_loop(created[:amostra], resolved[:amostra], calendar)
+    tempo_linha = (time.perf_counter() - start) * rows / amostra
+
+    return {
+        'linhas': rows,
+        'resultado_identico': bool(np.allclose(vetorizado[:amostra], linha_a_linha, equal_nan=True)),
+        'linha_a_linha_segundos_estimado': round(tempo_linha, 3),
+        'vetorizado_segundos': round(tempo_vetorizado, 3),
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    for chave, valor in benchmark(linhas).items():
+        print(f'{chave}: {valor}')
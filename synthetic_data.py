@@ -0,0 +1,195 @@
+import argparse
+import datetime
+import html
+import os
+
+import numpy as np
+
+from jira_dates import MONTH_MAP
+
+# Cabeçalhos da 'issuetable', na mesma ordem da exportação real ('Jira (3).html')
+HEADERS = [
+    'Projeto', 'Chave', 'Resumo', 'Tipo de item', 'Status', 'Prioridade', 'Resolução', 'Responsável', 'Relator',
+    'Criador', 'Criado', 'Última visualização', 'Atualizado(a)', 'Resolvido', 'Versões afetadas', 'Versões corrigidas',
+    'Componentes', 'Data limite', 'Votos', 'Seguidores', 'Imagens', 'Estimativa original',
+    'Estimativa de trabalho restante', 'Tempo gasto', 'Razão Trabalhada', 'Subtarefas', 'Itens associados', 'Ambiente',
+    'Descrição', 'Nível de Segurança', 'Progresso', 'Σ de Progresso', 'Σ de Tempo Gasto',
+    'Σ da estimativa de trabalho restante', 'Σ da Estimativa Original', 'Categorias', 'Categoria do status alterada',
+    'Categoria do status', 'Pai', 'Actual end', 'Actual start', 'Approvers', 'Category', 'Change reason', 'Change risk',
+    'Change type', 'Dispositivo', 'Epic Color', 'Epic Link', 'Epic Name', 'Epic Status', 'Flagged', 'Impact',
+    'Indisponível ou Inoperante', 'Issue color', 'Formulários bloqueados', 'Formulários abertos', 'Organizations',
+    'Parent Link', 'Participantes', 'Project overview key', 'Project overview status', 'Rank', 'Request Type',
+    'Responsável pela execução', 'Sistema Operacional', 'Sprint', 'Start date', 'Status Prazo', 'Story Points',
+    'Story point estimate', 'Formulários enviados', 'Target end', 'Target start', 'Team', 'Formulários totais',
+    'Unidade', 'Versão do App', '[CHART] Date of First Response', 'development',
+]
+
+# Distribuições aproximadas das observadas na exportação real
+TIPOS = (['Bug', 'Melhoria', 'Tarefa', 'Epic', 'História'], [0.64, 0.21, 0.10, 0.04, 0.01])
+STATUS = (['Concluído', 'Em andamento', 'Cancelado', 'Não iniciado', 'Pendente de informação', 'Pronto para revisão'],
+          [0.66, 0.17, 0.10, 0.045, 0.02, 0.005])
+PRIORIDADES = (['Media', 'Alta', 'Baixa', 'Urgente'], [0.90, 0.06, 0.03, 0.01])
+MODULOS = ['Interface Cidadão', 'Videoconferência', 'Mensageria', 'Director', 'Avaliação de atendimento',
+           'Área logada Cidadão', 'Atende', 'Agendamento', 'Integração', 'Chatbot', 'OCR', '']
+PESSOAS = ['Alex Goulart', 'Fernanda  Rodrigues', 'André Moreira Anjos', 'Ana Sousa', 'Carlos Henrique Alves',
+           'Mario Eva de Albuquerque', 'Eduardo Soares de Oliveira', 'Não atribuído']
+VERSOES = [f'V{major}.{minor}' for major in range(1, 6) for minor in range(0, 25)]
+PALAVRAS = ('erro tela cidadão serviço agendamento botão mensagem chamada vídeo relatório integração login '
+            'formulário envio e-mail página atendimento consulta cadastro documento').split()
+
+MESES = {en: pt for pt, en in MONTH_MAP.items()}
+
+PROJECT_KEY = 'SYN'
+
+
+# Data no formato da exportação do Jira em português (ex.: '22/mai/24 10:26 AM')
+def jira_date(value):
+    if value is None:
+        return ''
+    text = value.strftime('%d/%b/%y %I:%M %p')
+    return text[:3] + MESES[text[3:6]] + text[6:]
+
+
+def _texto(rng, palavras):
+    return ' '.join(rng.choice(PALAVRAS, palavras)).capitalize()
+
+
+def _cell(css_class, content):
+    return f'<td class="{css_class}">{content}</td>'
+
+
+# Gera os itens um a um (dicionário cabeçalho -> texto), com datas coerentes entre si
+def iter_issues(issues, seed=0, start=datetime.datetime(2022, 1, 3, 9, 0)):
+    rng = np.random.default_rng(seed)
+    span_minutes = 3 * 365 * 24 * 60
+    for number in range(issues, 0, -1):
+        criado = start + datetime.timedelta(minutes=int(rng.integers(0, span_minutes)))
+        status = rng.choice(STATUS[0], p=STATUS[1])
+        resolvido = None
+        if status in ('Concluído', 'Cancelado'):
+            resolvido = criado + datetime.timedelta(minutes=int(rng.exponential(9 * 24 * 60)))
+        resposta = None
+        if rng.random() < 0.7:
+            resposta = criado + datetime.timedelta(minutes=int(rng.exponential(2 * 24 * 60)))
+        atualizado = max(d for d in (criado, resolvido, resposta) if d is not None)
+        responsavel = rng.choice(PESSOAS)
+        yield {
+            'Projeto': 'RJ - Comitê Técnico - Web',
+            'Chave': f'{PROJECT_KEY}-{number}',
+            'Resumo': _texto(rng, 6),
+            'Tipo de item': rng.choice(TIPOS[0], p=TIPOS[1]),
+            'Status': status,
+            'Prioridade': rng.choice(PRIORIDADES[0], p=PRIORIDADES[1]),
+            'Resolução': 'Itens concluídos' if resolvido else 'Não resolvido(s)',
+            'Responsável': responsavel,
+            'Relator': rng.choice(PESSOAS),
+            'Criador': rng.choice(PESSOAS),
+            'Criado': jira_date(criado),
+            'Última visualização': jira_date(atualizado),
+            'Atualizado(a)': jira_date(atualizado),
+            'Resolvido': jira_date(resolvido),
+            'Votos': '0',
+            'Seguidores': str(int(rng.integers(1, 5))),
+            'Descrição': _texto(rng, int(rng.integers(5, 40))),
+            'Pai': rng.choice(MODULOS),
+            '[CHART] Date of First Response': jira_date(resposta),
+        }
+
+
+# Linha <tr> no mesmo estilo da exportação real (links, spans e entidades HTML)
+def _issue_row(issue):
+    cells = []
+    for header in HEADERS:
+        value = html.escape(issue.get(header, ''))
+        if header == 'Chave':
+            value = f'<a class="issue-link" data-issue-key="{value}" href="https://jira.example/browse/{value}">{value}</a>'
+        elif header == 'Resumo':
+            value = f'<p>\n    {value}\n</p>'
+        elif header == 'Status':
+            value = f'<span class="jira-issue-status-lozenge aui-lozenge">{value}</span>'
+        elif header == 'Resolução':
+            value = f'<em>{value}</em>'
+        elif not value:
+            value = '&nbsp;'
+        cells.append(_cell(header, value))
+    return '<tr class="issuerow">\n' + '\n'.join(cells) + '\n</tr>\n'
+
+
+# Grava uma exportação HTML sintética do Jira com 'issues' itens, linha a linha
+def write_html_export(path, issues, seed=0):
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('<html>\n<head>\n<title>Jira</title>\n'
+                   '<META HTTP-EQUIV="Content-Type" Content="application/vnd.ms-excel; charset=UTF-8">\n</head>\n<body>\n')
+        file.write(f'<table border="1"><tr><td colspan="{len(HEADERS)}">Exibindo {issues} itens.</td></tr></table>\n')
+        file.write('<table id="issuetable" class="aui " border="1" cellpadding="3" cellspacing="1" width="100%">\n<thead>\n'
+                   '<tr class="rowHeader">\n')
+        for header in HEADERS:
+            file.write(f'<th class="colHeaderLink">\n    {html.escape(header)}\n</th>\n')
+        file.write('</tr>\n</thead>\n<tbody>\n')
+        for issue in iter_issues(issues, seed):
+            file.write(_issue_row(issue))
+        file.write('</tbody>\n</table>\n</body>\n</html>\n')
+
+
+# Grava um backlog.xlsx sintético: parte dos itens aparece em abas por módulo, alguns em mais de uma
+# aba, com 'Data Pré'/'Data Produção' misturando datas e textos livres como na planilha real
+def write_backlog_workbook(path, issues, seed=0, sheets=8, share=0.3, duplicate_share=0.05):
+    from openpyxl import Workbook
+
+    rng = np.random.default_rng(seed + 1)
+    workbook = Workbook(write_only=True)
+    columns = ['Data do registro', 'Pessoa que fez o registro', 'Tipo', '#JIRA\nCard', 'Descrição', 'Equipe',
+               'Versão', 'Data Pré', 'Data Produção', 'Observações']
+    worksheets = [workbook.create_sheet(f'Módulo {index + 1}') for index in range(sheets)]
+    for worksheet in worksheets:
+        worksheet.append(columns)
+
+    textos_livres = ['Final de Agosto', 'Julho', 'Previsão: final de junho', 'A definir']
+    base = datetime.datetime(2022, 1, 3)
+    for number in range(1, issues + 1):
+        if rng.random() >= share:
+            continue
+        copies = 2 if rng.random() < duplicate_share else 1
+        for sheet_index in rng.choice(sheets, copies, replace=False):
+            registro = base + datetime.timedelta(days=int(rng.integers(0, 3 * 365)))
+            data_pre = registro + datetime.timedelta(days=int(rng.integers(5, 60))) if rng.random() < 0.6 else None
+            if data_pre is not None and rng.random() < 0.2:
+                data_pre = str(rng.choice(textos_livres))
+            data_producao = None
+            if isinstance(data_pre, datetime.datetime) and rng.random() < 0.5:
+                data_producao = data_pre + datetime.timedelta(days=int(rng.integers(1, 30)))
+            worksheets[sheet_index].append([
+                registro, str(rng.choice(PESSOAS)), str(rng.choice(['Bug', 'Melhoria'])), f'{PROJECT_KEY}-{number}',
+                _texto(rng, 8), 'Equipe Web', str(rng.choice(VERSOES)), data_pre, data_producao, None,
+            ])
+    workbook.save(path)
+
+
+# Caminhos padrão dos arquivos sintéticos para um tamanho
+def dataset_paths(output_dir, issues):
+    return (os.path.join(output_dir, f'jira_{issues}.html'), os.path.join(output_dir, f'backlog_{issues}.xlsx'))
+
+
+# Gera (ou reaproveita, se já existirem) a exportação HTML e o backlog de um tamanho
+def ensure_dataset(output_dir, issues, seed=0):
+    os.makedirs(output_dir, exist_ok=True)
+    html_path, backlog_path = dataset_paths(output_dir, issues)
+    if not os.path.exists(html_path):
+        write_html_export(html_path + '.tmp', issues, seed)
+        os.replace(html_path + '.tmp', html_path)
+    if not os.path.exists(backlog_path):
+        write_backlog_workbook(backlog_path + '.tmp.xlsx', issues, seed)
+        os.replace(backlog_path + '.tmp.xlsx', backlog_path)
+    return html_path, backlog_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Gera exportações sintéticas do Jira (HTML) e planilhas de backlog')
+    parser.add_argument('--issues', type=int, nargs='+', default=[1000], help='quantidades de itens (ex.: 1000 100000)')
+    parser.add_argument('--output-dir', default='benchmark_data')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for quantidade in args.issues:
+        for caminho in ensure_dataset(args.output_dir, quantidade, args.seed):
+            print(f'{caminho}: {os.path.getsize(caminho) / 2 ** 20:.1f} MB')
@@ -0,0 +1,29 @@
+import pandas as pd
+
+from jira_loader import KEY_COLUMN, UPDATED_COLUMN
+from jira_store import ingest_issues, read_issues, read_manifest
+
+
+def _item(key, updated, summary='resumo'):
+    dates = {column: [pd.NaT] for column in ['Criado', 'Resolvido', '[CHART] Date of First Response']}
+    return pd.DataFrame({KEY_COLUMN: [key], UPDATED_COLUMN: [pd.Timestamp(updated)], 'Resumo': [summary], **dates})
+
+
+# Um item novo com 'Atualizado(a)' mais antigo que a marca d'água ainda é gravado
+def test_new_key_older_than_watermark_is_written(tmp_path):
+    assert ingest_issues(_item('A-1', '2024-06-01'), tmp_path)['linhas_gravadas'] == 1
+    assert ingest_issues(_item('B-1', '2024-01-01'), tmp_path)['linhas_gravadas'] == 1
+    assert sorted(read_issues(tmp_path)[KEY_COLUMN]) == ['A-1', 'B-1']
+    assert read_manifest(tmp_path)['watermark'] == pd.Timestamp('2024-06-01').isoformat()
+
+
+# Reingerir o mesmo item não grava nada; uma versão mais nova substitui a guardada
+def test_reingest_writes_only_newer_versions(tmp_path):
+    ingest_issues(_item('A-1', '2024-06-01'), tmp_path)
+    assert ingest_issues(_item('A-1', '2024-06-01'), tmp_path)['linhas_gravadas'] == 0
+    assert ingest_issues(_item('A-1', '2024-05-01', 'antigo'), tmp_path)['linhas_gravadas'] == 0
+    assert ingest_issues(_item('A-1', '2024-07-01', 'novo'), tmp_path)['linhas_gravadas'] == 1
+
+    issues = read_issues(tmp_path)
+    assert issues[KEY_COLUMN].tolist() == ['A-1']
+    assert issues['Resumo'].tolist() == ['novo']